@@ -1,13 +1,35 @@
-"""Benchmark internal operations of fastapi-fsp to identify bottlenecks."""
-
+"""Benchmark internal operations of fastapi-fsp to identify bottlenecks.
+
+Set ``PROFILE=1`` to additionally run every benchmark under ``cProfile`` and
+dump one ``.pstats`` file per benchmark into ``PROFILE_DIR`` (default
+``profiles/``). Inspect them with ``python -m pstats <file>`` or
+``snakeviz <file>`` to see whether coercion, pydantic validation or
+SQLAlchemy compilation dominates.
+
+Results are collected while the benchmarks run and written in one go at the
+end; pass ``--format=json`` for machine-readable output.
+"""
+
+import argparse
+import cProfile
+import itertools
+import json
+import os
+import re
+import sys
 import time
 from datetime import datetime, timedelta
-from typing import Optional
-from unittest.mock import Mock
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
 
+import numpy as np
+from fastapi_fsp.filters import FilterEngine
 from fastapi_fsp.fsp import FSPManager
 from fastapi_fsp.models import Filter, FilterOperator, OrFilterGroup, PaginationQuery, SortingQuery
+from sqlalchemy import StaticPool, event
 from sqlmodel import Field, Session, SQLModel, create_engine, select
+from starlette.datastructures import URL
 
 
 class Hero(SQLModel, table=True):
@@ -23,59 +45,192 @@ class Hero(SQLModel, table=True):
     city: str = Field(default="")
 
 
-def time_function(func, iterations: int = 1000):
-    """Time a function execution."""
+PROFILE = bool(os.environ.get("PROFILE"))
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "profiles")
+_profile_seq = itertools.count(1)
+
+
+def profile_function(func, iterations: int, label: str) -> str:
+    """Run ``func`` under cProfile and dump the stats to ``PROFILE_DIR``.
+
+    Args:
+        func: Zero-argument callable to profile
+        iterations: Number of calls to record
+        label: Benchmark name used to build the output file name
+
+    Returns:
+        Path of the written ``.pstats`` file
+    """
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_").lower() or "benchmark"
+    path = os.path.join(PROFILE_DIR, f"{next(_profile_seq):03d}_{slug}.pstats")
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(iterations):
+        func()
+    profiler.disable()
+    profiler.dump_stats(path)
+    return path
+
+
+def time_function(func, iterations: int = 1000, label: Optional[str] = None):
+    """Time a function execution.
+
+    When ``PROFILE`` is enabled, an extra profiled pass runs after the timed
+    loop so profiler overhead never leaks into the reported timings.
+    """
     # Warmup
     for _ in range(10):
         func()
 
-    # Benchmark
-    timings = []
-    for _ in range(iterations):
-        start = time.perf_counter()
+    # Benchmark (bind the timer locally so lookups don't pollute the measurement)
+    perf_counter = time.perf_counter
+    timings = np.empty(iterations, dtype=np.float64)
+    for i in range(iterations):
+        start = perf_counter()
         func()
-        end = time.perf_counter()
-        timings.append(end - start)
+        end = perf_counter()
+        timings[i] = end - start
+
+    # np.partition only places the requested ranks, avoiding a full sort
+    idx = np.array([int(iterations * 0.5), int(iterations * 0.95)])
+    p50, p95 = np.partition(timings, idx)[idx]
+    avg = timings.mean()
 
-    timings.sort()
-    avg = sum(timings) / len(timings)
-    p50 = timings[int(len(timings) * 0.5)]
-    p95 = timings[int(len(timings) * 0.95)]
+    if PROFILE:
+        profile_function(func, iterations, label or getattr(func, "__name__", "benchmark"))
     return {"avg": avg * 1000, "p50": p50 * 1000, "p95": p95 * 1000}
 
 
+RESULTS: List[Dict[str, Any]] = []
+
+
+def record(
+    benchmark: str, name: str, result: Dict[str, float], dataset: Optional[int] = None
+) -> None:
+    """Collect a result; nothing is printed until every benchmark has run."""
+    RESULTS.append({"benchmark": benchmark, "dataset": dataset, "name": name, **result})
+
+
+def render_text(results: List[Dict[str, Any]]) -> str:
+    """Render collected results in the human-readable report format."""
+    lines = ["=" * 80, "FASTAPI-FSP INTERNAL BENCHMARKS", "=" * 80]
+    section = dataset = None
+    for row in results:
+        if row["benchmark"] != section:
+            section, dataset = row["benchmark"], None
+            lines.append(f"\n=== Benchmark: {section} ===")
+        indent = "  "
+        if row["dataset"] is not None:
+            if row["dataset"] != dataset:
+                dataset = row["dataset"]
+                lines.append(f"\n  Dataset: {dataset} records")
+            indent = "    "
+        lines.append(
+            f"{indent}{row['name']:30s} - Avg: {row['avg']:6.3f}ms, "
+            f"P50: {row['p50']:6.3f}ms, P95: {row['p95']:6.3f}ms"
+        )
+    lines += ["\n" + "=" * 80, "BENCHMARKS COMPLETE", "=" * 80]
+    return "\n".join(lines) + "\n"
+
+
+def set_sqlite_pragmas(dbapi_conn, _connection_record):
+    """Disable durability work that is pure noise for an in-memory benchmark database."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # 64MB page cache keeps the 10k-row read benchmarks fully in memory
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+
+# Real starlette URL so link generation pays the production query-string cost,
+# wrapped in a plain namespace instead of a Mock that records every call
+FAKE_REQUEST = SimpleNamespace(url=URL("http://example.com/heroes/"))
+
+HERO_INSERT_SQL = (
+    "INSERT INTO hero (name, secret_name, age, created_at, deleted, email, city) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def hero_rows(num_records: int):
+    """Generate raw hero rows for seeding, bypassing ORM instantiation."""
+    cities = np.array(["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"])
+    base_time = datetime.now()
+    # Only 365 distinct timestamps exist; format each once in SQLite's storage format
+    stamps = [(base_time - timedelta(days=d)).isoformat(" ", "microseconds") for d in range(365)]
+
+    ids = np.arange(num_records)
+    names = [f"Hero_{i}" for i in range(num_records)]
+    secret_names = [f"Secret_{i}" for i in range(num_records)]
+    emails = [f"hero_{i}@example.com" for i in range(num_records)]
+    ages = (20 + ids % 60).tolist()
+    created = [stamps[d] for d in (ids % 365).tolist()]
+    deleted = (ids % 10 == 0).tolist()
+    city = cities[ids % len(cities)].tolist()
+    return list(zip(names, secret_names, ages, created, deleted, emails, city))
+
+
 def setup_database(num_records: int = 1000):
     """Set up in-memory database with test data."""
-    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    # StaticPool hands out one connection, so every session sees the seeded database
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    event.listen(engine, "connect", set_sqlite_pragmas)
     SQLModel.metadata.create_all(engine)
 
-    cities = ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"]
-    base_time = datetime.now()
-
-    with Session(engine) as session:
-        heroes = []
-        for i in range(num_records):
-            hero = Hero(
-                name=f"Hero_{i}",
-                secret_name=f"Secret_{i}",
-                age=20 + (i % 60),
-                created_at=base_time - timedelta(days=i % 365),
-                deleted=i % 10 == 0,
-                email=f"hero_{i}@example.com",
-                city=cities[i % len(cities)],
-            )
-            heroes.append(hero)
-        session.add_all(heroes)
-        session.commit()
+    with engine.begin() as conn:
+        conn.exec_driver_sql(HERO_INSERT_SQL, hero_rows(num_records))
 
     return engine
 
 
+@lru_cache(maxsize=None)
+def get_engine(num_records: int = 1000):
+    """Return a populated database engine, building it once per dataset size."""
+    return setup_database(num_records)
+
+
+class _PrecompiledFilterEngine(FilterEngine):
+    """FilterEngine that hands back AND conditions built ahead of time."""
+
+    def __init__(self, conditions: List[Any], strict_mode: bool = False):
+        super().__init__(strict_mode=strict_mode)
+        self._conditions = conditions
+
+    def filter_conditions(self, query, columns_map, filters, resolved=None):
+        return list(self._conditions)
+
+
+def precompile(fsp: FSPManager, query) -> FSPManager:
+    """
+    Build the manager's filter conditions once and reuse them on every call.
+
+    Separates per-call condition construction (column lookup, coercion,
+    strategy dispatch) from the rest of the pipeline, so the difference
+    between the cold and precompiled rows shows what filter building costs.
+    The manager gets its own engine, so the shared per-mode engines used by
+    every other FSPManager are left untouched.
+    """
+    columns = query.selected_columns
+    conditions = [
+        FSPManager._build_filter_condition(columns[f.field], f) for f in fsp.filters or []
+    ]
+    fsp._filter_engine = _PrecompiledFilterEngine(conditions, strict_mode=fsp.strict_mode)
+    return fsp
+
+
 def benchmark_coerce_value():
     """Benchmark _coerce_value method."""
-    print("\n=== Benchmark: _coerce_value ===")
+    section = "_coerce_value"
 
-    engine = setup_database(10)
+    engine = get_engine(10)
     with Session(engine):
         query = select(Hero)
         columns = query.selected_columns
@@ -96,16 +251,13 @@ def benchmark_coerce_value():
         }
 
         for name, func in tests.items():
-            result = time_function(func, iterations=10000)
-            print(
-                f"  {name:30s} - Avg: {result['avg']:6.3f}ms, "
-                f"P50: {result['p50']:6.3f}ms, P95: {result['p95']:6.3f}ms"
-            )
+            result = time_function(func, iterations=10000, label=name)
+            record(section, name, result)
 
 
 def benchmark_split_values():
     """Benchmark _split_values method."""
-    print("\n=== Benchmark: _split_values ===")
+    section = "_split_values"
 
     tests = {
         "Split 3 values": lambda: FSPManager._split_values("val1,val2,val3"),
@@ -116,18 +268,15 @@ def benchmark_split_values():
     }
 
     for name, func in tests.items():
-        result = time_function(func, iterations=10000)
-        print(
-            f"  {name:30s} - Avg: {result['avg']:6.3f}ms, "
-            f"P50: {result['p50']:6.3f}ms, P95: {result['p95']:6.3f}ms"
-        )
+        result = time_function(func, iterations=10000, label=name)
+        record(section, name, result)
 
 
 def benchmark_apply_filter():
     """Benchmark _build_filter_condition method."""
-    print("\n=== Benchmark: _build_filter_condition ===")
+    section = "_build_filter_condition"
 
-    engine = setup_database(100)
+    engine = get_engine(100)
     with Session(engine):
         base_query = select(Hero)
         columns = base_query.selected_columns
@@ -156,26 +305,21 @@ def benchmark_apply_filter():
         }
 
         for name, func in tests.items():
-            result = time_function(func, iterations=1000)
-            print(
-                f"  {name:30s} - Avg: {result['avg']:6.3f}ms, "
-                f"P50: {result['p50']:6.3f}ms, P95: {result['p95']:6.3f}ms"
-            )
+            result = time_function(func, iterations=1000, label=name)
+            record(section, name, result)
 
 
-def benchmark_apply_filters():
-    """Benchmark _apply_filters method with multiple filters."""
-    print("\n=== Benchmark: _apply_filters ===")
+def benchmark_apply_all():
+    """Benchmark FilterEngine.apply_all, the filter step of generate_response."""
+    section = "apply_all"
 
-    engine = setup_database(100)
+    engine = get_engine(100)
     with Session(engine):
         base_query = select(Hero)
         columns = base_query.selected_columns
 
-        # Create mock request for FSPManager
-        request = Mock()
-        request.url = Mock()
-        request.url.include_query_params = Mock(return_value="http://example.com")
+        # Lightweight request stub for FSPManager
+        request = FAKE_REQUEST
         pagination = PaginationQuery(page=1, per_page=20)
 
         filters_1 = [Filter(field="age", operator=FilterOperator.GTE, value="30")]
@@ -204,33 +348,36 @@ def benchmark_apply_filters():
         )
 
         tests = {
-            "1 filter": lambda: fsp_1._apply_filters(base_query, columns, filters_1),
-            "3 filters": lambda: fsp_3._apply_filters(base_query, columns, filters_3),
-            "5 filters": lambda: fsp_5._apply_filters(base_query, columns, filters_5),
-            "No filters": lambda: fsp_none._apply_filters(base_query, columns, None),
+            "1 filter": lambda: fsp_1._filter_engine.apply_all(
+                base_query, columns, filters_1, None
+            ),
+            "3 filters": lambda: fsp_3._filter_engine.apply_all(
+                base_query, columns, filters_3, None
+            ),
+            "5 filters": lambda: fsp_5._filter_engine.apply_all(
+                base_query, columns, filters_5, None
+            ),
+            "No filters": lambda: fsp_none._filter_engine.apply_all(
+                base_query, columns, None, None
+            ),
         }
 
         for name, func in tests.items():
-            result = time_function(func, iterations=1000)
-            print(
-                f"  {name:30s} - Avg: {result['avg']:6.3f}ms, "
-                f"P50: {result['p50']:6.3f}ms, P95: {result['p95']:6.3f}ms"
-            )
+            result = time_function(func, iterations=1000, label=name)
+            record(section, name, result)
 
 
 def benchmark_apply_sort():
     """Benchmark _apply_sort method."""
-    print("\n=== Benchmark: _apply_sort ===")
+    section = "_apply_sort"
 
-    engine = setup_database(100)
+    engine = get_engine(100)
     with Session(engine):
         base_query = select(Hero)
         columns = base_query.selected_columns
 
-        # Create mock request for FSPManager
-        request = Mock()
-        request.url = Mock()
-        request.url.include_query_params = Mock(return_value="http://example.com")
+        # Lightweight request stub for FSPManager
+        request = FAKE_REQUEST
         pagination = PaginationQuery(page=1, per_page=20)
 
         from fastapi_fsp.models import SortingOrder
@@ -264,25 +411,20 @@ def benchmark_apply_sort():
         }
 
         for name, func in tests.items():
-            result = time_function(func, iterations=1000)
-            print(
-                f"  {name:30s} - Avg: {result['avg']:6.3f}ms, "
-                f"P50: {result['p50']:6.3f}ms, P95: {result['p95']:6.3f}ms"
-            )
+            result = time_function(func, iterations=1000, label=name)
+            record(section, name, result)
 
 
 def benchmark_apply_or_filters():
     """Benchmark _apply_or_filters method with tokenized search groups."""
-    print("\n=== Benchmark: _apply_or_filters (tokenized search) ===")
+    section = "_apply_or_filters (tokenized search)"
 
-    engine = setup_database(100)
+    engine = get_engine(100)
     with Session(engine):
         base_query = select(Hero)
         columns = base_query.selected_columns
 
-        request = Mock()
-        request.url = Mock()
-        request.url.include_query_params = Mock(return_value="http://example.com")
+        request = FAKE_REQUEST
         pagination = PaginationQuery(page=1, per_page=20)
 
         # Phrase mode: 1 group with 3 fields
@@ -352,30 +494,24 @@ def benchmark_apply_or_filters():
         }
 
         for name, func in tests.items():
-            result = time_function(func, iterations=1000)
-            print(
-                f"  {name:30s} - Avg: {result['avg']:6.3f}ms, "
-                f"P50: {result['p50']:6.3f}ms, P95: {result['p95']:6.3f}ms"
-            )
+            result = time_function(func, iterations=1000, label=name)
+            record(section, name, result)
 
 
 def benchmark_generate_response_search():
     """Benchmark full generate_response with tokenized search at various dataset sizes."""
-    print("\n=== Benchmark: generate_response (tokenized search) ===")
+    section = "generate_response (tokenized search)"
 
     from fastapi_fsp.config import FSPConfig
     from fastapi_fsp.models import SearchBackend
 
     for num_records in [100, 1000, 10000]:
-        print(f"\n  Dataset: {num_records} records")
-        engine = setup_database(num_records)
+        engine = get_engine(num_records)
 
         with Session(engine) as session:
             base_query = select(Hero)
 
-            request = Mock()
-            request.url = Mock()
-            request.url.include_query_params = Mock(return_value="http://example.com")
+            request = FAKE_REQUEST
             pagination = PaginationQuery(page=1, per_page=20)
 
             # Phrase: 1 group, 3 fields
@@ -460,20 +596,16 @@ def benchmark_generate_response_search():
             }
 
             for name, func in tests.items():
-                result = time_function(func, iterations=50)
-                print(
-                    f"    {name:30s} - Avg: {result['avg']:6.3f}ms, "
-                    f"P50: {result['p50']:6.3f}ms, P95: {result['p95']:6.3f}ms"
-                )
+                result = time_function(func, iterations=50, label=name)
+                record(section, name, result, dataset=num_records)
 
 
 def benchmark_count_total():
     """Benchmark _count_total method."""
-    print("\n=== Benchmark: _count_total ===")
+    section = "_count_total"
 
     for num_records in [100, 1000, 10000]:
-        print(f"\n  Dataset: {num_records} records")
-        engine = setup_database(num_records)
+        engine = get_engine(num_records)
 
         with Session(engine) as session:
             base_query = select(Hero)
@@ -494,28 +626,22 @@ def benchmark_count_total():
             }
 
             for name, func in tests.items():
-                result = time_function(func, iterations=100)
-                print(
-                    f"    {name:30s} - Avg: {result['avg']:6.3f}ms, "
-                    f"P50: {result['p50']:6.3f}ms, P95: {result['p95']:6.3f}ms"
-                )
+                result = time_function(func, iterations=100, label=name)
+                record(section, name, result, dataset=num_records)
 
 
 def benchmark_pagination():
     """Benchmark pagination method."""
-    print("\n=== Benchmark: paginate ===")
+    section = "paginate"
 
     for num_records in [100, 1000, 10000]:
-        print(f"\n  Dataset: {num_records} records")
-        engine = setup_database(num_records)
+        engine = get_engine(num_records)
 
         with Session(engine) as session:
             base_query = select(Hero)
 
-            # Create mock request and FSPManager
-            request = Mock()
-            request.url = Mock()
-            request.url.include_query_params = Mock(return_value="http://example.com")
+            # Request stub and FSPManager
+            request = FAKE_REQUEST
 
             pagination = PaginationQuery(page=1, per_page=20)
             fsp = FSPManager(
@@ -544,28 +670,22 @@ def benchmark_pagination():
             }
 
             for name, func in tests.items():
-                result = time_function(func, iterations=100)
-                print(
-                    f"    {name:30s} - Avg: {result['avg']:6.3f}ms, "
-                    f"P50: {result['p50']:6.3f}ms, P95: {result['p95']:6.3f}ms"
-                )
+                result = time_function(func, iterations=100, label=name)
+                record(section, name, result, dataset=num_records)
 
 
 def benchmark_generate_response():
     """Benchmark full generate_response method."""
-    print("\n=== Benchmark: generate_response (full pipeline) ===")
+    section = "generate_response (full pipeline)"
 
     for num_records in [100, 1000, 10000]:
-        print(f"\n  Dataset: {num_records} records")
-        engine = setup_database(num_records)
+        engine = get_engine(num_records)
 
         with Session(engine) as session:
             base_query = select(Hero)
 
-            # Create mock request
-            request = Mock()
-            request.url = Mock()
-            request.url.include_query_params = Mock(return_value="http://example.com")
+            # Request stub
+            request = FAKE_REQUEST
 
             # Simple pagination
             pagination = PaginationQuery(page=1, per_page=20)
@@ -593,29 +713,42 @@ def benchmark_generate_response():
             def complex_response():
                 return fsp_complex.generate_response(base_query, session)
 
+            # Same query with filter conditions built once, outside the timed loop
+            fsp_precompiled = precompile(
+                FSPManager(
+                    request=request,
+                    filters=filters,
+                    sorting=sorting,
+                    pagination=pagination,
+                    or_filters=None,
+                ),
+                base_query,
+            )
+
+            def precompiled_response():
+                return fsp_precompiled.generate_response(base_query, session)
+
             tests = {
                 "Simple (no filters/sort)": simple_response,
                 "Complex (filters + sort)": complex_response,
+                "Complex (precompiled)": precompiled_response,
             }
 
             for name, func in tests.items():
-                result = time_function(func, iterations=50)
-                print(
-                    f"    {name:30s} - Avg: {result['avg']:6.3f}ms, "
-                    f"P50: {result['p50']:6.3f}ms, P95: {result['p95']:6.3f}ms"
-                )
+                result = time_function(func, iterations=50, label=name)
+                record(section, name, result, dataset=num_records)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Run all internal benchmarks."""
-    print("=" * 80)
-    print("FASTAPI-FSP INTERNAL BENCHMARKS")
-    print("=" * 80)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args(argv)
 
     benchmark_coerce_value()
     benchmark_split_values()
     benchmark_apply_filter()
-    benchmark_apply_filters()
+    benchmark_apply_all()
     benchmark_apply_or_filters()
     benchmark_apply_sort()
     benchmark_count_total()
@@ -623,9 +756,10 @@ def main():
     benchmark_generate_response()
     benchmark_generate_response_search()
 
-    print("\n" + "=" * 80)
-    print("BENCHMARKS COMPLETE")
-    print("=" * 80)
+    if args.format == "json":
+        sys.stdout.write(json.dumps(RESULTS, indent=2) + "\n")
+    else:
+        sys.stdout.write(render_text(RESULTS))
 
 
 if __name__ == "__main__":
@@ -1,14 +1,20 @@
 """Comprehensive benchmark suite for fastapi-fsp package."""
 
+import argparse
+import asyncio
+import json
+import sys
 import time
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional
 
-from fastapi import Depends, FastAPI
-from fastapi.testclient import TestClient
+import httpx
+import numpy as np
+from fastapi import Depends, FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi_fsp.fsp import FSPManager
 from fastapi_fsp.models import PaginatedResponse
-from sqlalchemy import StaticPool
+from sqlalchemy import StaticPool, event
 from sqlmodel import Field, Session, SQLModel, create_engine, select
 
 
@@ -36,12 +42,77 @@ class HeroPublic(HeroBase):
     id: int
 
 
+def set_sqlite_pragmas(dbapi_conn, _connection_record):
+    """Disable durability work that is pure noise for an in-memory benchmark database."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # 64MB page cache keeps the 10k-row read benchmarks fully in memory
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+
+HERO_INSERT_SQL = (
+    "INSERT INTO hero (name, secret_name, age, created_at, deleted, email, city) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def hero_rows(num_records: int):
+    """Generate raw hero rows for seeding, bypassing ORM instantiation."""
+    cities = np.array(["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"])
+    base_time = datetime.now()
+    # Only 365 distinct timestamps exist; format each once in SQLite's storage format
+    stamps = [(base_time - timedelta(days=d)).isoformat(" ", "microseconds") for d in range(365)]
+
+    ids = np.arange(num_records)
+    names = [f"Hero_{i}" for i in range(num_records)]
+    secret_names = [f"Secret_{i}" for i in range(num_records)]
+    emails = [f"hero_{i}@example.com" for i in range(num_records)]
+    ages = (20 + ids % 60).tolist()
+    created = [stamps[d] for d in (ids % 365).tolist()]
+    deleted = (ids % 10 == 0).tolist()
+    city = cities[ids % len(cities)].tolist()
+    return list(zip(names, secret_names, ages, created, deleted, emails, city))
+
+
+class ASGIClient:
+    """Minimal synchronous client driving the app in-process over ASGI.
+
+    Unlike ``TestClient``, requests are not relayed through an anyio thread
+    portal: every call is a single hop on one persistent event loop.
+    """
+
+    def __init__(self, app: FastAPI, base_url: str = "http://test"):
+        self._loop = asyncio.new_event_loop()
+        self._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=base_url)
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request and wait for the response."""
+        return self._loop.run_until_complete(self._client.get(url, **kwargs))
+
+    def build_request(self, method: str, url: str, **kwargs: Any) -> httpx.Request:
+        """Build a request once so it can be replayed with ``send``."""
+        return self._client.build_request(method, url, **kwargs)
+
+    def send(self, request: httpx.Request) -> httpx.Response:
+        """Send a prebuilt request and wait for the response."""
+        return self._loop.run_until_complete(self._client.send(request))
+
+    def close(self):
+        """Close the underlying client and event loop."""
+        self._loop.run_until_complete(self._client.aclose())
+        self._loop.close()
+
+
 class BenchmarkResult:
     """Container for benchmark results."""
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, capacity: int):
         self.name = name
-        self.timings: List[float] = []
+        self.timings = np.empty(capacity, dtype=np.float64)
+        self._count = 0
         self.avg_time: float = 0.0
         self.min_time: float = 0.0
         self.max_time: float = 0.0
@@ -52,20 +123,41 @@ class BenchmarkResult:
 
     def add_timing(self, duration: float):
         """Add a timing measurement."""
-        self.timings.append(duration)
+        self.timings[self._count] = duration
+        self._count += 1
 
     def calculate_stats(self):
         """Calculate statistics from timings."""
-        if not self.timings:
+        if not self._count:
             return
-        self.timings.sort()
-        self.iterations = len(self.timings)
-        self.avg_time = sum(self.timings) / self.iterations
-        self.min_time = self.timings[0]
-        self.max_time = self.timings[-1]
-        self.p50_time = self.timings[int(self.iterations * 0.5)]
-        self.p95_time = self.timings[int(self.iterations * 0.95)]
-        self.p99_time = self.timings[int(self.iterations * 0.99)]
+        timings = self.timings[: self._count]
+        self.iterations = self._count
+        self.avg_time = float(timings.mean())
+        self.min_time = float(timings.min())
+        self.max_time = float(timings.max())
+        idx = np.array(
+            [
+                int(self.iterations * 0.5),
+                int(self.iterations * 0.95),
+                int(self.iterations * 0.99),
+            ]
+        )
+        self.p50_time, self.p95_time, self.p99_time = (
+            float(v) for v in np.partition(timings, idx)[idx]
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Machine-readable representation of the results (times in ms)."""
+        return {
+            "name": self.name,
+            "iterations": self.iterations,
+            "avg": self.avg_time * 1000,
+            "min": self.min_time * 1000,
+            "max": self.max_time * 1000,
+            "p50": self.p50_time * 1000,
+            "p95": self.p95_time * 1000,
+            "p99": self.p99_time * 1000,
+        }
 
     def __str__(self) -> str:
         """String representation of benchmark results."""
@@ -99,8 +191,10 @@ class BenchmarkSuite:
             connect_args={"check_same_thread": False},
             poolclass=StaticPool,
         )
-        self.app = FastAPI()
-        self.client = None
+        event.listen(self.engine, "connect", set_sqlite_pragmas)
+        # orjson encodes straight to bytes in Rust, several times faster than stdlib json
+        self.app = FastAPI(default_response_class=ORJSONResponse)
+        self.client: Optional[ASGIClient] = None
         self.results: Dict[str, BenchmarkResult] = {}
 
     def setup(self):
@@ -108,28 +202,19 @@ class BenchmarkSuite:
         SQLModel.metadata.create_all(self.engine)
         self._populate_database()
         self._setup_app()
-        self.client = TestClient(self.app)
+        self.client = ASGIClient(self.app)
+
+    def teardown(self):
+        """Release the client and database resources."""
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+        self.engine.dispose()
 
     def _populate_database(self):
         """Populate database with test data."""
-        cities = ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"]
-        base_time = datetime.now()
-
-        with Session(self.engine) as session:
-            heroes = []
-            for i in range(self.num_records):
-                hero = Hero(
-                    name=f"Hero_{i}",
-                    secret_name=f"Secret_{i}",
-                    age=20 + (i % 60),
-                    created_at=base_time - timedelta(days=i % 365),
-                    deleted=i % 10 == 0,
-                    email=f"hero_{i}@example.com",
-                    city=cities[i % len(cities)],
-                )
-                heroes.append(hero)
-            session.add_all(heroes)
-            session.commit()
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(HERO_INSERT_SQL, hero_rows(self.num_records))
 
     def _setup_app(self):
         """Set up FastAPI app with endpoints."""
@@ -147,6 +232,18 @@ class BenchmarkSuite:
             query = select(Hero)
             return fsp.generate_response(query, session)
 
+        # Same payload without response_model: skips FastAPI's re-validation of
+        # every HeroPublic and serializes straight from pydantic-core
+        @self.app.get("/heroes_raw/", response_model=None)
+        def read_heroes_raw(
+            *,
+            session: Session = Depends(get_session),
+            fsp: FSPManager = Depends(FSPManager),
+        ) -> Response:
+            query = select(Hero)
+            body = fsp.generate_response(query, session).model_dump_json()
+            return Response(content=body, media_type="application/json")
+
     def _run_benchmark(self, name: str, request_func: Callable[[], Any]) -> BenchmarkResult:
         """
         Run a single benchmark.
@@ -158,18 +255,20 @@ class BenchmarkSuite:
         Returns:
             BenchmarkResult: Results of the benchmark
         """
-        result = BenchmarkResult(name)
+        result = BenchmarkResult(name, self.iterations)
 
         # Warmup
         for _ in range(10):
             request_func()
 
-        # Actual benchmark
+        # Actual benchmark (bind hot names locally to keep lookups out of the loop)
+        perf_counter = time.perf_counter
+        add_timing = result.add_timing
         for _ in range(self.iterations):
-            start = time.perf_counter()
+            start = perf_counter()
             request_func()
-            end = time.perf_counter()
-            result.add_timing(end - start)
+            end = perf_counter()
+            add_timing(end - start)
 
         result.calculate_stats()
         self.results[name] = result
@@ -191,6 +290,14 @@ class BenchmarkSuite:
 
         return self._run_benchmark("Large Page (100 items)", request)
 
+    def benchmark_large_page_raw(self):
+        """Benchmark large page size without response model validation."""
+
+        def request():
+            return self.client.get("/heroes_raw/?page=1&per_page=100")
+
+        return self._run_benchmark("Large Page Raw (100 items)", request)
+
     def benchmark_deep_pagination(self):
         """Benchmark pagination at a deeper page."""
 
@@ -226,23 +333,39 @@ class BenchmarkSuite:
     def benchmark_multiple_filters(self):
         """Benchmark multiple filters."""
 
+        params = [
+            ("field", "age"),
+            ("operator", "gte"),
+            ("value", "30"),
+            ("field", "deleted"),
+            ("operator", "eq"),
+            ("value", "false"),
+            ("field", "city"),
+            ("operator", "eq"),
+            ("value", "Chicago"),
+        ]
+        prepared = self.client.build_request("GET", "/heroes/", params=params)
+
         def request():
-            return self.client.get(
-                "/heroes/?field=age&operator=gte&value=30"
-                "&field=deleted&operator=eq&value=false"
-                "&field=city&operator=eq&value=Chicago"
-            )
+            return self.client.send(prepared)
 
         return self._run_benchmark("Multiple Filters (3 conditions)", request)
 
     def benchmark_indexed_filters(self):
         """Benchmark indexed filter format."""
 
+        params = [
+            ("filters[0][field]", "age"),
+            ("filters[0][operator]", "gte"),
+            ("filters[0][value]", "30"),
+            ("filters[1][field]", "deleted"),
+            ("filters[1][operator]", "eq"),
+            ("filters[1][value]", "false"),
+        ]
+        prepared = self.client.build_request("GET", "/heroes/", params=params)
+
         def request():
-            return self.client.get(
-                "/heroes/?filters[0][field]=age&filters[0][operator]=gte&filters[0][value]=30"
-                "&filters[1][field]=deleted&filters[1][operator]=eq&filters[1][value]=false"
-            )
+            return self.client.send(prepared)
 
         return self._run_benchmark("Indexed Filters (2 conditions)", request)
 
@@ -291,14 +414,25 @@ class BenchmarkSuite:
     def benchmark_complex_query(self):
         """Benchmark complex query with multiple filters, sort, and pagination."""
 
+        params = [
+            ("field", "age"),
+            ("operator", "gte"),
+            ("value", "25"),
+            ("field", "age"),
+            ("operator", "lte"),
+            ("value", "60"),
+            ("field", "deleted"),
+            ("operator", "eq"),
+            ("value", "false"),
+            ("sort_by", "age"),
+            ("order", "desc"),
+            ("page", "2"),
+            ("per_page", "25"),
+        ]
+        prepared = self.client.build_request("GET", "/heroes/", params=params)
+
         def request():
-            return self.client.get(
-                "/heroes/?field=age&operator=gte&value=25"
-                "&field=age&operator=lte&value=60"
-                "&field=deleted&operator=eq&value=false"
-                "&sort_by=age&order=desc"
-                "&page=2&per_page=25"
-            )
+            return self.client.send(prepared)
 
         return self._run_benchmark("Complex Query (filters+sort+pagination)", request)
 
@@ -361,17 +495,24 @@ class BenchmarkSuite:
 
         return self._run_benchmark("Search Token + Sort + Pagination", request)
 
-    def run_all_benchmarks(self) -> Dict[str, BenchmarkResult]:
-        """Run all benchmarks and return results."""
-        print(
-            f"Running benchmarks with {self.num_records} records, "
-            f"{self.iterations} iterations each..."
-        )
-        print("=" * 80)
+    def run_all_benchmarks(self, report: bool = True) -> Dict[str, BenchmarkResult]:
+        """
+        Run all benchmarks and return results.
+
+        Args:
+            report: Print the human-readable results once all benchmarks finished
+        """
+        if report:
+            print(
+                f"Running benchmarks with {self.num_records} records, "
+                f"{self.iterations} iterations each..."
+            )
+            print("=" * 80)
 
         benchmarks = [
             self.benchmark_basic_pagination,
             self.benchmark_large_page,
+            self.benchmark_large_page_raw,
             self.benchmark_deep_pagination,
             self.benchmark_single_filter_eq,
             self.benchmark_single_filter_range,
@@ -393,10 +534,11 @@ class BenchmarkSuite:
         ]
 
         for benchmark in benchmarks:
-            result = benchmark()
-            print(result)
-            print("-" * 80)
+            benchmark()
 
+        # Report only after the timed runs so terminal I/O never interleaves with them
+        if report:
+            print("\n".join(f"{result}\n{'-' * 80}" for result in self.results.values()))
         return self.results
 
     def print_summary(self):
@@ -411,19 +553,39 @@ class BenchmarkSuite:
         for i, result in enumerate(sorted_results, 1):
             print(f"{i}. {result.name}: {result.avg_time * 1000:.2f}ms avg")
 
+        validated = self.results.get("Large Page (100 items)")
+        raw = self.results.get("Large Page Raw (100 items)")
+        if validated and raw and validated.avg_time:
+            overhead = (validated.avg_time - raw.avg_time) / validated.avg_time * 100
+            print(f"\nResponse validation overhead (100 items): {overhead:.1f}% of request time")
 
-def main():
+
+def main(argv: Optional[List[str]] = None):
     """Run benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args(argv)
+
+    report: Dict[int, List[Dict[str, Any]]] = {}
     # Test with different dataset sizes
     for num_records in [100, 1000, 10000]:
-        print(f"\n\n{'=' * 80}")
-        print(f"TESTING WITH {num_records} RECORDS")
-        print(f"{'=' * 80}\n")
-
         suite = BenchmarkSuite(num_records=num_records, iterations=50)
         suite.setup()
-        suite.run_all_benchmarks()
-        suite.print_summary()
+        try:
+            if args.format == "json":
+                suite.run_all_benchmarks(report=False)
+                report[num_records] = [r.to_dict() for r in suite.results.values()]
+            else:
+                print(f"\n\n{'=' * 80}")
+                print(f"TESTING WITH {num_records} RECORDS")
+                print(f"{'=' * 80}\n")
+                suite.run_all_benchmarks()
+                suite.print_summary()
+        finally:
+            suite.teardown()
+
+    if args.format == "json":
+        sys.stdout.write(json.dumps(report, indent=2) + "\n")
 
 
 if __name__ == "__main__":
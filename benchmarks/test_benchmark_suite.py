@@ -0,0 +1,41 @@
+"""pytest-benchmark entry point for the BenchmarkSuite endpoints.
+
+Runs every ``BenchmarkSuite.benchmark_*`` request through the ``benchmark``
+fixture, which calibrates rounds, rejects outliers and can persist baselines
+for regression checks::
+
+    pytest benchmarks/ --no-cov --benchmark-autosave
+    pytest benchmarks/ --no-cov --benchmark-compare --benchmark-compare-fail=mean:10%
+
+The module lives outside ``testpaths`` so the regular test run never picks it up.
+"""
+
+import pytest
+
+from benchmarks.benchmark_suite import BenchmarkSuite
+
+BENCHMARKS = sorted(name for name in dir(BenchmarkSuite) if name.startswith("benchmark_"))
+
+
+@pytest.fixture(scope="module", params=[1000, 10000], ids=lambda n: f"{n}_records")
+def suite(request):
+    """Seeded suite shared by every benchmark of one dataset size."""
+    suite = BenchmarkSuite(num_records=request.param)
+    suite.setup()
+    yield suite
+    suite.teardown()
+
+
+@pytest.mark.parametrize("method", BENCHMARKS)
+def test_endpoint(benchmark, suite, method):
+    benchmark.group = f"{suite.num_records} records"
+
+    def run_benchmark(name, request_func):
+        benchmark.name = name
+        response = benchmark(request_func)
+        assert response.status_code == 200
+        return response
+
+    # Reuse the suite's request definitions, timing them with pytest-benchmark instead
+    suite._run_benchmark = run_benchmark
+    getattr(suite, method)()
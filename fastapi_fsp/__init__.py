@@ -19,7 +19,7 @@ from .models import (  # noqa: F401
     SortingOrder,
     SortingQuery,
 )
-from .pagination import PaginationEngine  # noqa: F401
+from .pagination import CountCache, PaginationEngine  # noqa: F401
 from .presets import CommonFilters  # noqa: F401
 from .sorting import SortEngine  # noqa: F401
 
@@ -30,6 +30,8 @@ __all__ = [
     "FilterEngine",
     "SortEngine",
     "PaginationEngine",
+    # Count caching
+    "CountCache",
     # Strategy registry
     "FILTER_STRATEGIES",
     # Builder
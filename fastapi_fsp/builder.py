@@ -1,11 +1,39 @@
 """FilterBuilder API for creating filters with a fluent interface."""
 
 from datetime import date, datetime
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from fastapi_fsp.models import Filter, FilterOperator, OrFilterGroup
 
 
+@lru_cache(maxsize=1024)
+def _cached_isoformat(value: datetime, tzinfo: Any) -> str:
+    """Format a datetime, memoized; tzinfo is part of the key (see _datetime_to_str)."""
+    return value.isoformat()
+
+
+def _datetime_to_str(value: datetime) -> str:
+    """
+    ISO 8601 form of a datetime, cached for bounds reused across filters.
+
+    Aware datetimes for the same instant in different zones compare (and hash)
+    equal but format differently, so the tzinfo is added to the cache key.
+    """
+    return _cached_isoformat(value, value.tzinfo)
+
+
+# Exact-type converters used by FieldBuilder._to_str; subclasses take the isinstance path
+_TO_STR_DISPATCH: Dict[type, Callable[[Any], str]] = {
+    str: str,
+    int: str,
+    float: str,
+    bool: lambda v: "true" if v else "false",
+    datetime: _datetime_to_str,
+    date: date.isoformat,
+}
+
+
 class FieldBuilder:
     """
     Builder for a single field's filter conditions.
@@ -13,6 +41,8 @@ class FieldBuilder:
     Provides a fluent interface for building filter conditions on a specific field.
     """
 
+    __slots__ = ("_filter_builder", "_field")
+
     def __init__(self, filter_builder: "FilterBuilder", field: str):
         """
         Initialize FieldBuilder.
@@ -26,6 +56,8 @@ class FieldBuilder:
 
     def _add_filter(self, operator: FilterOperator, value: str) -> "FilterBuilder":
         """Add a filter and return the parent builder."""
+        # Plain construction: pydantic-core validation of three typed fields is
+        # cheaper than the pure-Python model_construct path
         self._filter_builder._filters.append(
             Filter(field=self._field, operator=operator, value=value)
         )
@@ -34,6 +66,9 @@ class FieldBuilder:
     @staticmethod
     def _to_str(value: Union[str, int, float, bool, date, datetime]) -> str:
         """Convert a value to string representation."""
+        convert = _TO_STR_DISPATCH.get(type(value))
+        if convert is not None:
+            return convert(value)
         if isinstance(value, bool):
             return "true" if value else "false"
         if isinstance(value, datetime):
@@ -42,6 +77,25 @@ class FieldBuilder:
             return value.isoformat()
         return str(value)
 
+    @staticmethod
+    def _join_values(values: List[Union[str, int, float, bool, date, datetime]]) -> str:
+        """Convert values to a comma-separated string."""
+        if isinstance(values, (list, tuple)) and values:
+            value_type = type(values[0])
+            if value_type is str:
+                # str.join checks the element types itself, in C
+                try:
+                    return ",".join(values)
+                except TypeError:
+                    pass
+            else:
+                # Homogeneous lists resolve their converter once instead of per element
+                convert = _TO_STR_DISPATCH.get(value_type)
+                if convert is not None and all(type(v) is value_type for v in values):
+                    return ",".join([convert(v) for v in values])
+        to_str = FieldBuilder._to_str
+        return ",".join([to_str(v) for v in values])
+
     def eq(self, value: Union[str, int, float, bool, date, datetime]) -> "FilterBuilder":
         """
         Equal to (=).
@@ -172,7 +226,7 @@ class FieldBuilder:
         Returns:
             FilterBuilder: Parent builder for chaining
         """
-        str_values = ",".join(self._to_str(v) for v in values)
+        str_values = self._join_values(values)
         return self._add_filter(FilterOperator.IN, str_values)
 
     def not_in(self, values: List[Union[str, int, float, bool, date, datetime]]) -> "FilterBuilder":
@@ -185,7 +239,7 @@ class FieldBuilder:
         Returns:
             FilterBuilder: Parent builder for chaining
         """
-        str_values = ",".join(self._to_str(v) for v in values)
+        str_values = self._join_values(values)
         return self._add_filter(FilterOperator.NOT_IN, str_values)
 
     def between(
@@ -275,8 +329,14 @@ class FilterBuilder:
         )
 
     This creates a list of Filter objects that can be used with FSPManager.
+
+    The comparison operators are also available as single calls taking the
+    field name, building the same filter as ``.where(field).<op>(value)``:
+        filters = FilterBuilder().gte("age", 30).eq("city", "Chicago").build()
     """
 
+    __slots__ = ("_filters",)
+
     def __init__(self):
         """Initialize an empty FilterBuilder."""
         self._filters: List[Filter] = []
@@ -308,6 +368,88 @@ class FilterBuilder:
         self._filters.append(Filter(field=field, operator=operator, value=value))
         return self
 
+    def eq(
+        self, field: str, value: Union[str, int, float, bool, date, datetime]
+    ) -> "FilterBuilder":
+        """
+        Equal to (=) on a field, without an intermediate FieldBuilder.
+
+        Args:
+            field: Field name
+            value: Value to compare against
+
+        Returns:
+            FilterBuilder: Self for chaining
+        """
+        return self.add_filter(field, FilterOperator.EQ, FieldBuilder._to_str(value))
+
+    def ne(
+        self, field: str, value: Union[str, int, float, bool, date, datetime]
+    ) -> "FilterBuilder":
+        """
+        Not equal to (!=) on a field, without an intermediate FieldBuilder.
+
+        Args:
+            field: Field name
+            value: Value to compare against
+
+        Returns:
+            FilterBuilder: Self for chaining
+        """
+        return self.add_filter(field, FilterOperator.NE, FieldBuilder._to_str(value))
+
+    def gt(self, field: str, value: Union[str, int, float, date, datetime]) -> "FilterBuilder":
+        """
+        Greater than (>) on a field, without an intermediate FieldBuilder.
+
+        Args:
+            field: Field name
+            value: Value to compare against
+
+        Returns:
+            FilterBuilder: Self for chaining
+        """
+        return self.add_filter(field, FilterOperator.GT, FieldBuilder._to_str(value))
+
+    def gte(self, field: str, value: Union[str, int, float, date, datetime]) -> "FilterBuilder":
+        """
+        Greater than or equal to (>=) on a field, without an intermediate FieldBuilder.
+
+        Args:
+            field: Field name
+            value: Value to compare against
+
+        Returns:
+            FilterBuilder: Self for chaining
+        """
+        return self.add_filter(field, FilterOperator.GTE, FieldBuilder._to_str(value))
+
+    def lt(self, field: str, value: Union[str, int, float, date, datetime]) -> "FilterBuilder":
+        """
+        Less than (<) on a field, without an intermediate FieldBuilder.
+
+        Args:
+            field: Field name
+            value: Value to compare against
+
+        Returns:
+            FilterBuilder: Self for chaining
+        """
+        return self.add_filter(field, FilterOperator.LT, FieldBuilder._to_str(value))
+
+    def lte(self, field: str, value: Union[str, int, float, date, datetime]) -> "FilterBuilder":
+        """
+        Less than or equal to (<=) on a field, without an intermediate FieldBuilder.
+
+        Args:
+            field: Field name
+            value: Value to compare against
+
+        Returns:
+            FilterBuilder: Self for chaining
+        """
+        return self.add_filter(field, FilterOperator.LTE, FieldBuilder._to_str(value))
+
     def add_filters(self, filters: List[Filter]) -> "FilterBuilder":
         """
         Add multiple filters at once.
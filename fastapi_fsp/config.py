@@ -1,12 +1,18 @@
 """Configuration classes for fastapi-fsp."""
 
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 from fastapi_fsp.models import SearchBackend
+from fastapi_fsp.pagination import CountCache
 
+# Default upper bound on the filters a request may carry
+_DEFAULT_MAX_FILTERS = 64
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class FSPConfig:
     """
     Configuration for FSP behavior.
@@ -22,6 +28,17 @@ class FSPConfig:
         allow_deep_pagination: If True, allow pagination to any page (default: True)
         max_page: Maximum allowed page number, None for unlimited (default: None)
         min_per_page: Minimum allowed items per page (default: 1)
+        count_cache: Optional CountCache for pagination totals (default: None)
+        late_row_lookup: If True, page through a primary-key subquery (default: False)
+        approximate_count: If True, use PostgreSQL planner estimates for totals
+            (default: False)
+        count_sample_percent: PostgreSQL TABLESAMPLE percentage used to estimate
+            totals, None to disable (default: None)
+        max_filters: Maximum number of filters a request may send, None for
+            unlimited; filters added with with_filters() do not count (default: 64)
+
+    Instances are immutable and hashable; use ``dataclasses.replace`` to derive
+    a modified copy.
 
     Example:
         # Create a strict configuration
@@ -61,8 +78,21 @@ class FSPConfig:
     search_backend: SearchBackend = SearchBackend.ILIKE
     max_search_tokens: int = 10
 
+    # Upper bound on filters per request, so crafted query strings cannot tie up a worker
+    max_filters: Optional[int] = _DEFAULT_MAX_FILTERS
+
+    # Count caching (shared across requests; not part of equality)
+    count_cache: Optional[CountCache] = field(default=None, compare=False)
+
+    # Offset pagination via a primary-key-only subquery
+    late_row_lookup: bool = False
+
+    # PostgreSQL only: total_items from EXPLAIN row estimates instead of count(*)
+    approximate_count: bool = False
+    count_sample_percent: Optional[float] = None
+
     # Reserved for future features
-    _extra: dict = field(default_factory=dict)
+    _extra: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}), compare=False)
 
     def __post_init__(self):
         """Validate configuration values."""
@@ -82,6 +112,10 @@ class FSPConfig:
             raise ValueError("max_page must be >= 1 or None")
         if self.max_search_tokens < 1:
             raise ValueError("max_search_tokens must be >= 1")
+        if self.max_filters is not None and self.max_filters < 1:
+            raise ValueError("max_filters must be >= 1 or None")
+        if self.count_sample_percent is not None and not 0 < self.count_sample_percent <= 100:
+            raise ValueError("count_sample_percent must be in (0, 100]")
 
     def validate_page(self, page: int) -> int:
         """
@@ -127,20 +161,35 @@ class FSPPresets:
     """Pre-defined FSPConfig presets for common use cases."""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def default() -> FSPConfig:
-        """Default configuration with sensible defaults."""
+        """
+        Default configuration with sensible defaults.
+
+        The same instance is returned on every call; derive customized copies
+        with ``dataclasses.replace`` instead of mutating it.
+        """
         return FSPConfig()
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def strict() -> FSPConfig:
-        """Strict mode configuration - raises errors for unknown fields."""
+        """
+        Strict mode configuration - raises errors for unknown fields.
+
+        The same instance is returned on every call; derive customized copies
+        with ``dataclasses.replace`` instead of mutating it.
+        """
         return FSPConfig(strict_mode=True)
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def limited_pagination(max_page: int = 100, max_per_page: int = 50) -> FSPConfig:
         """
         Configuration that limits deep pagination.
 
+        Calls with the same arguments return the same instance.
+
         Args:
             max_page: Maximum allowed page number
             max_per_page: Maximum items per page
@@ -152,10 +201,13 @@ class FSPPresets:
         )
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def high_volume(max_per_page: int = 500, default_per_page: int = 100) -> FSPConfig:
         """
         Configuration for high-volume APIs.
 
+        Calls with the same arguments return the same instance.
+
         Args:
             max_per_page: Maximum items per page
             default_per_page: Default items per page
@@ -1,10 +1,10 @@
 """Filter engine with strategy pattern for operator handling."""
 
 import re
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from dateutil.parser import parse
 from fastapi import HTTPException, status
 from sqlalchemy import (
     ColumnCollection,
@@ -14,10 +14,12 @@ from sqlalchemy import (
     String,
     cast,
     func,
+    inspect,
     literal,
     or_,
     text,
 )
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.sql.type_api import TypeDecorator
 from sqlmodel import not_
 
@@ -26,6 +28,33 @@ from fastapi_fsp.models import Filter, FilterOperator, OrFilterGroup
 # Type alias for filter strategy functions
 FilterStrategyFn = Callable[[ColumnElement[Any], str, Optional[type]], Optional[Any]]
 
+# Instance attributes under which per-column facts are memoized
+_PYTYPE_ATTR = "_fsp_python_type"
+_IS_STRING_ATTR = "_fsp_is_string"
+_MISSING = object()
+
+# Splits on commas and swallows surrounding whitespace in a single regex pass
+_SPLIT_RE = re.compile(r"\s*,\s*").split
+# Accepted spellings of boolean filter values
+_BOOL_TOKENS: Dict[str, bool] = {
+    "true": True,
+    "1": True,
+    "t": True,
+    "yes": True,
+    "y": True,
+    "false": False,
+    "0": False,
+    "f": False,
+    "no": False,
+    "n": False,
+}
+# Sentinel for datetime strings that need the (uncached) dateutil fallback
+_UNPARSED_DATETIME = object()
+# Common non-ISO layouts tried with strptime before falling back to dateutil
+_DATETIME_FORMATS = ("%Y/%m/%d %H:%M:%S", "%Y/%m/%d")
+# Detects whether a raw value needs the whitespace-aware split at all
+_HAS_SPACE = re.compile(r"\s").search
+
 
 def _coerce_value(column: ColumnElement[Any], raw: str, pytype: Optional[type] = None) -> Any:
     """
@@ -44,14 +73,90 @@ def _coerce_value(column: ColumnElement[Any], raw: str, pytype: Optional[type] =
             pytype = getattr(column.type, "python_type", None)
         except Exception:
             pytype = None
-    if pytype is None or isinstance(raw, pytype):
+    # Exact-type pointer compare first; isinstance only for subclasses
+    if pytype is None or type(raw) is pytype or isinstance(raw, pytype):
         return raw
+    value = _coerce_cached(pytype, raw)
+    if value is _UNPARSED_DATETIME:
+        # dateutil fills missing parts from the current date, so it is not cached;
+        # it is also slow to import, so only load it for such free-form values
+        from dateutil.parser import parse
+
+        try:
+            return parse(raw)
+        except ValueError:
+            return raw
+    return value
+
+
+def _entity_attribute(entity: Any, field: str) -> Optional[ColumnElement[Any]]:
+    """
+    Resolve a column-like attribute on a mapped entity.
+
+    Plain mapped attributes are memoized on (entity, field). A hybrid_property
+    re-runs its expression function on every access and that function may read
+    runtime state (the current time, a context variable), so hybrids are
+    resolved on each call.
+
+    Args:
+        entity: Mapped class (or aliased class) of the query
+        field: Name of the attribute
+
+    Returns:
+        Optional[ColumnElement]: The SQL expression if available, None otherwise
+    """
+    attr = _mapped_attribute(entity, field)
+    if attr is _MISSING:
+        return _resolve_entity_attribute(entity, field)
+    return attr
+
+
+@lru_cache(maxsize=1024)
+def _mapped_attribute(entity: Any, field: str) -> Any:
+    """Memoized attribute for an instrumented mapper attribute, else ``_MISSING``."""
+    mapper = getattr(inspect(entity, raiseerr=False), "mapper", None)
+    if mapper is None or not isinstance(
+        mapper.all_orm_descriptors.get(field), InstrumentedAttribute
+    ):
+        return _MISSING
+    return _resolve_entity_attribute(entity, field)
+
+
+def _resolve_entity_attribute(entity: Any, field: str) -> Optional[ColumnElement[Any]]:
+    """Look up an attribute on the entity and return its SQL expression, if any."""
+    attr = getattr(entity, field, None)
+    if attr is None:
+        return None
+
+    if isinstance(attr, ColumnElement):
+        return attr
+
+    if hasattr(attr, "__clause_element__"):
+        return attr.__clause_element__()
+
+    return None
+
+
+@lru_cache(maxsize=2048)
+def _coerce_cached(pytype: type, raw: str) -> Any:
+    """
+    Coerce a raw string to a Python type, memoized on (pytype, raw).
+
+    The same (type, value) pairs recur across requests (e.g. ``(int, "30")``,
+    ``(bool, "false")``), so repeated coercions become a cache hit.
+
+    Args:
+        pytype: Target Python type
+        raw: Raw string value
+
+    Returns:
+        Any: Coerced value, or ``_UNPARSED_DATETIME`` if a datetime string
+            is not ISO 8601
+    """
     if pytype is bool:
-        val = raw.strip().lower()
-        if val in {"true", "1", "t", "yes", "y"}:
-            return True
-        if val in {"false", "0", "f", "no", "n"}:
-            return False
+        parsed = _BOOL_TOKENS.get(raw.strip().lower())
+        if parsed is not None:
+            return parsed
     if pytype is int:
         try:
             return int(raw)
@@ -64,10 +169,18 @@ def _coerce_value(column: ColumnElement[Any], raw: str, pytype: Optional[type] =
         try:
             return datetime.fromisoformat(raw)
         except (ValueError, AttributeError):
+            pass
+        for fmt in _DATETIME_FORMATS:
             try:
-                return parse(raw)
+                return datetime.strptime(raw, fmt)
             except ValueError:
-                return raw
+                continue
+        return _UNPARSED_DATETIME
+    if pytype is date:
+        try:
+            return date.fromisoformat(raw)
+        except ValueError:
+            return raw
     try:
         return pytype(raw)
     except Exception:
@@ -84,13 +197,52 @@ def _split_values(raw: str) -> List[str]:
     Returns:
         List[str]: List of stripped values
     """
-    return [item.strip() for item in raw.split(",")]
+    # Clients usually send "a,b,c": a plain C-level split avoids the regex entirely
+    if _HAS_SPACE(raw) is None:
+        return raw.split(",")
+    return _SPLIT_RE(raw.strip())
+
+
+def _column_memo(column: Any, key: str, compute: Callable[[Any], Any]) -> Any:
+    """
+    Return ``compute(column)``, memoized in the column's own ``__dict__``.
+
+    Mirrors how SQLAlchemy stores its memoized attributes, so the value is
+    shared across requests and lives exactly as long as the column. Objects
+    without a ``__dict__`` are computed uncached.
+
+    Args:
+        column: SQLAlchemy column element
+        key: Attribute name to memoize under
+        compute: Function deriving the value from the column
+
+    Returns:
+        Any: The memoized value
+    """
+    column_dict = getattr(column, "__dict__", None)
+    if column_dict is None:
+        return compute(column)
+    value = column_dict.get(key, _MISSING)
+    if value is _MISSING:
+        value = column_dict[key] = compute(column)
+    return value
+
+
+def _resolve_python_type(column: ColumnElement[Any]) -> Optional[type]:
+    """Resolve the Python type of a column, or None if it has none."""
+    try:
+        return getattr(column.type, "python_type", None)
+    except (AttributeError, NotImplementedError):
+        return None
 
 
 def _is_string_column(col: ColumnElement[Any]) -> bool:
     """
     Check if a column has a string type in the database.
 
+    The answer is memoized on the column, so LIKE-style strategies only
+    inspect the column type once.
+
     Non-string columns (integer, float, datetime, etc.) need to be cast
     to text before ILIKE/LIKE pattern matching can be applied.
 
@@ -103,6 +255,11 @@ def _is_string_column(col: ColumnElement[Any]) -> bool:
     Returns:
         bool: True if the column is a string/text type
     """
+    return _column_memo(col, _IS_STRING_ATTR, _resolve_is_string)
+
+
+def _resolve_is_string(col: ColumnElement[Any]) -> bool:
+    """Inspect a column's type to decide whether it is a string type."""
     col_type = col.type
     # Enum inherits from String in SQLAlchemy but PostgreSQL enums
     # don't support ILIKE, so they must be cast to text
@@ -227,6 +384,34 @@ def _strategy_contains(column: ColumnElement[Any], raw: str, pytype: Optional[ty
     return _as_text(column).ilike(pattern)
 
 
+# Relative evaluation cost/selectivity of each operator; apply_filters emits
+# AND conditions in ascending order (stable, so ties keep request order)
+_OPERATOR_WEIGHT: Dict[FilterOperator, int] = {
+    FilterOperator.EQ: 0,
+    FilterOperator.IS_NULL: 0,
+    FilterOperator.IN: 1,
+    FilterOperator.IS_NOT_NULL: 1,
+    FilterOperator.NE: 2,
+    FilterOperator.GT: 2,
+    FilterOperator.GTE: 2,
+    FilterOperator.LT: 2,
+    FilterOperator.LTE: 2,
+    FilterOperator.BETWEEN: 2,
+    FilterOperator.NOT_IN: 3,
+    FilterOperator.LIKE: 4,
+    FilterOperator.NOT_LIKE: 4,
+    FilterOperator.STARTS_WITH: 4,
+    FilterOperator.ILIKE: 5,
+    FilterOperator.NOT_ILIKE: 5,
+    FilterOperator.ENDS_WITH: 6,
+    FilterOperator.CONTAINS: 6,
+}
+
+
+def _filter_weight(f: Filter) -> int:
+    return _OPERATOR_WEIGHT.get(f.operator, 4)
+
+
 # Strategy registry: maps FilterOperator -> handler function
 FILTER_STRATEGIES: Dict[FilterOperator, FilterStrategyFn] = {
     FilterOperator.EQ: _strategy_eq,
@@ -325,25 +510,22 @@ class FilterEngine:
         """
         self.strict_mode = strict_mode
         self.search_backend: str = "ilike"
-        self._type_cache: dict[int, Optional[type]] = {}
 
-    def get_column_type(self, column: ColumnElement[Any]) -> Optional[type]:
+    @staticmethod
+    def get_column_type(column: ColumnElement[Any]) -> Optional[type]:
         """
         Get the Python type of a column with caching.
 
+        The type is memoized on the column itself, so it is shared across
+        requests and lives exactly as long as the column.
+
         Args:
             column: SQLAlchemy column element
 
         Returns:
             Optional[type]: Python type of the column or None
         """
-        col_id = id(column)
-        if col_id not in self._type_cache:
-            try:
-                self._type_cache[col_id] = getattr(column.type, "python_type", None)
-            except (AttributeError, NotImplementedError):
-                self._type_cache[col_id] = None
-        return self._type_cache[col_id]
+        return _column_memo(column, _PYTYPE_ATTR, _resolve_python_type)
 
     @staticmethod
     def get_entity_attribute(query: Select, field: str) -> Optional[ColumnElement[Any]]:
@@ -369,17 +551,7 @@ class FilterEngine:
             if entity is None:
                 return None
 
-            attr = getattr(entity, field, None)
-            if attr is None:
-                return None
-
-            if isinstance(attr, ColumnElement):
-                return attr
-
-            if hasattr(attr, "__clause_element__"):
-                return attr.__clause_element__()
-
-            return None
+            return _entity_attribute(entity, field)
         except Exception:
             return None
 
@@ -403,53 +575,148 @@ class FilterEngine:
             return None
         return strategy(column, f.value, pytype)
 
-    def apply_filters(
+    def _filter_condition(
+        self,
+        query: Select,
+        columns_map: ColumnCollection[str, ColumnElement[Any]],
+        f: Filter,
+        resolved: Optional[Dict[str, Optional[Tuple[Any, Optional[type]]]]] = None,
+    ) -> Optional[Any]:
+        """
+        Resolve a filter's field and build its SQL condition.
+
+        Args:
+            query: SQLAlchemy Select query
+            columns_map: Map of column names to column elements
+            f: Filter to build
+            resolved: Optional per-call memo of field -> (column, python type),
+                so repeated filters on one field resolve it only once
+
+        Returns:
+            Optional[Any]: SQLAlchemy condition, or None if the field is unknown
+                or the filter produces no condition
+
+        Raises:
+            HTTPException: If strict_mode is True and the field is unknown
+        """
+        if resolved is not None and f.field in resolved:
+            entry = resolved[f.field]
+        else:
+            column = columns_map.get(f.field)
+            if column is None:
+                column = self.get_entity_attribute(query, f.field)
+            entry = None if column is None else (column, self.get_column_type(column))
+            if resolved is not None:
+                resolved[f.field] = entry
+        if entry is None:
+            if self.strict_mode:
+                available = ", ".join(sorted(columns_map.keys()))
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown field '{f.field}'. Available fields: {available}",
+                )
+            return None
+        column, pytype = entry
+        return self.build_filter_condition(column, f, pytype)
+
+    def filter_conditions(
         self,
         query: Select,
         columns_map: ColumnCollection[str, ColumnElement[Any]],
         filters: Optional[List[Filter]],
-    ) -> Select:
+        resolved: Optional[Dict[str, Optional[Tuple[Any, Optional[type]]]]] = None,
+    ) -> List[Any]:
         """
-        Apply filters to a query.
+        Build the AND conditions for a list of filters.
 
         Args:
             query: Base SQLAlchemy Select query
             columns_map: Map of column names to column elements
-            filters: List of filters to apply
+            filters: List of filters to build
+            resolved: Optional per-call memo of field -> (column, python type)
 
         Returns:
-            Select: Query with filters applied
+            List[Any]: SQLAlchemy conditions, cheapest and most selective first
 
         Raises:
             HTTPException: If strict_mode is True and unknown field is encountered
         """
         if not filters:
-            return query
+            return []
+
+        # Cheap, selective predicates first: databases that evaluate AND terms
+        # in order (e.g. SQLite without a usable index) can stop early.
+        # Fields repeated across filters (ranges, exclusions) resolve once.
+        if resolved is None:
+            resolved = {}
+        return [
+            condition
+            for f in sorted(filters, key=_filter_weight)
+            if (condition := self._filter_condition(query, columns_map, f, resolved)) is not None
+        ]
+
+    def or_group_conditions(
+        self,
+        query: Select,
+        columns_map: ColumnCollection[str, ColumnElement[Any]],
+        or_groups: Optional[List[OrFilterGroup]],
+        resolved: Optional[Dict[str, Optional[Tuple[Any, Optional[type]]]]] = None,
+    ) -> List[Any]:
+        """
+        Build one OR'd condition per OR filter group.
 
-        conditions = []
-        for f in filters:
-            column = columns_map.get(f.field)
+        Args:
+            query: Base SQLAlchemy Select query
+            columns_map: Map of column names to column elements
+            or_groups: List of OR filter groups to build
+            resolved: Optional per-call memo of field -> (column, python type)
 
-            if column is None:
-                column = self.get_entity_attribute(query, f.field)
+        Returns:
+            List[Any]: SQLAlchemy conditions, one per non-empty group
 
-            if column is None:
-                if self.strict_mode:
-                    available = ", ".join(sorted(columns_map.keys()))
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Unknown field '{f.field}'. Available fields: {available}",
-                    )
-                continue
+        Raises:
+            HTTPException: If strict_mode is True and unknown field is encountered
+        """
+        if not or_groups:
+            return []
 
-            pytype = self.get_column_type(column)
-            condition = self.build_filter_condition(column, f, pytype)
-            if condition is not None:
-                conditions.append(condition)
+        if resolved is None:
+            resolved = {}
+        group_conditions = []
+        for group in or_groups:
+            conditions = [
+                condition
+                for f in group.filters
+                if (condition := self._filter_condition(query, columns_map, f, resolved))
+                is not None
+            ]
+            if conditions:
+                group_conditions.append(or_(*conditions))
+        return group_conditions
 
+    def apply_filters(
+        self,
+        query: Select,
+        columns_map: ColumnCollection[str, ColumnElement[Any]],
+        filters: Optional[List[Filter]],
+    ) -> Select:
+        """
+        Apply filters to a query.
+
+        Args:
+            query: Base SQLAlchemy Select query
+            columns_map: Map of column names to column elements
+            filters: List of filters to apply
+
+        Returns:
+            Select: Query with filters applied
+
+        Raises:
+            HTTPException: If strict_mode is True and unknown field is encountered
+        """
+        conditions = self.filter_conditions(query, columns_map, filters)
         if conditions:
             query = query.where(*conditions)
-
         return query
 
     def apply_or_filter_groups(
@@ -475,34 +742,47 @@ class FilterEngine:
         Raises:
             HTTPException: If strict_mode is True and unknown field is encountered
         """
-        if not or_groups:
-            return query
+        conditions = self.or_group_conditions(query, columns_map, or_groups)
+        if conditions:
+            query = query.where(*conditions)
+        return query
 
-        for group in or_groups:
-            conditions = []
-            for f in group.filters:
-                column = columns_map.get(f.field)
-
-                if column is None:
-                    column = self.get_entity_attribute(query, f.field)
-
-                if column is None:
-                    if self.strict_mode:
-                        available = ", ".join(sorted(columns_map.keys()))
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=f"Unknown field '{f.field}'. Available fields: {available}",
-                        )
-                    continue
-
-                pytype = self.get_column_type(column)
-                condition = self.build_filter_condition(column, f, pytype)
-                if condition is not None:
-                    conditions.append(condition)
+    def apply_all(
+        self,
+        query: Select,
+        columns_map: ColumnCollection[str, ColumnElement[Any]],
+        filters: Optional[List[Filter]],
+        or_groups: Optional[List[OrFilterGroup]],
+    ) -> Select:
+        """
+        Apply AND filters and OR filter groups in a single WHERE.
+
+        Equivalent to apply_filters() followed by the configured search backend
+        (or apply_or_filter_groups()), but copies the Select once instead of
+        once per filter list and group.
 
+        Args:
+            query: Base SQLAlchemy Select query
+            columns_map: Map of column names to column elements
+            filters: List of AND filters to apply
+            or_groups: List of OR filter groups to apply
+
+        Returns:
+            Select: Query with all filters applied
+
+        Raises:
+            HTTPException: If strict_mode is True and unknown field is encountered
+        """
+        resolved: Dict[str, Optional[Tuple[Any, Optional[type]]]] = {}
+        conditions = self.filter_conditions(query, columns_map, filters, resolved)
+        if or_groups and self.search_backend != "ilike":
             if conditions:
-                query = query.where(or_(*conditions))
+                query = query.where(*conditions)
+            return self.apply_search_optimized(query, columns_map, or_groups, self.search_backend)
 
+        conditions.extend(self.or_group_conditions(query, columns_map, or_groups, resolved))
+        if conditions:
+            query = query.where(*conditions)
         return query
 
     def _resolve_search_columns(
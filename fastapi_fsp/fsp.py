@@ -1,15 +1,22 @@
 """FastAPI-SQLModel-Pagination module"""
 
-from typing import Annotated, Any, List, Optional, Type
+import re
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Sequence, Tuple, Type
 
 from fastapi import Depends, HTTPException, Query, Request, status
-from pydantic import ValidationError
 from sqlalchemy import ColumnCollection, ColumnElement, Select
 from sqlmodel import Session, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
-
-from fastapi_fsp.config import FSPConfig
-from fastapi_fsp.filters import FilterEngine, _coerce_value, _is_string_column, _split_values
+from starlette.datastructures import QueryParams
+
+from fastapi_fsp.config import _DEFAULT_MAX_FILTERS, FSPConfig
+from fastapi_fsp.filters import (
+    FilterEngine,
+    _coerce_value,
+    _is_string_column,
+    _split_values,
+)
 from fastapi_fsp.models import (
     Filter,
     FilterOperator,
@@ -23,6 +30,11 @@ from fastapi_fsp.models import (
 from fastapi_fsp.pagination import PaginationEngine
 from fastapi_fsp.sorting import SortEngine
 
+# Indexed filter keys, e.g. filters[0][field]; no leading zeros, matching f"filters[{i}]"
+_INDEXED_FILTER_KEY = re.compile(r"filters\[(0|[1-9][0-9]*)\]\[(field|operator|value)\]").fullmatch
+_INDEXED_FILTER_PART = {"field": 0, "operator": 1, "value": 2}
+_OPERATORS: Dict[str, FilterOperator] = {op.value: op for op in FilterOperator}
+
 
 def _parse_one_filter_at(i: int, field: str, operator: str, value: str) -> Filter:
     """
@@ -40,23 +52,32 @@ def _parse_one_filter_at(i: int, field: str, operator: str, value: str) -> Filte
     Raises:
         HTTPException: If filter parameters are invalid
     """
-    try:
-        filter_ = Filter(field=field, operator=FilterOperator(operator), value=value)
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid filter at index {i}: {str(e)}",
-        ) from e
-    except ValueError as e:
+    op = _OPERATORS.get(operator)
+    if op is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid operator '{operator}' at index {i}.",
-        ) from e
-    return filter_
+        )
+    return Filter(field=field, operator=op, value=value)
+
+
+def _too_many_filters(limit: int) -> HTTPException:
+    """Build the error raised when a request carries more than ``limit`` filters."""
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Too many filters; at most {limit} are allowed.",
+    )
+
+
+class _TruncatedFilters(list):
+    """Request filters whose parsing stopped after exceeding the default limit."""
 
 
 def _parse_array_of_filters(
-    fields: List[str], operators: List[str], values: List[str]
+    fields: List[str],
+    operators: List[str],
+    values: List[str],
+    limit: Optional[int] = _DEFAULT_MAX_FILTERS,
 ) -> List[Filter]:
     """
     Parse filters from array format parameters.
@@ -65,6 +86,8 @@ def _parse_array_of_filters(
         fields: List of field names
         operators: List of operators
         values: List of values
+        limit: Maximum number of filters; parsing stops after ``limit + 1``
+            filters, None for unlimited
 
     Returns:
         List[Filter]: List of parsed filters
@@ -78,15 +101,72 @@ def _parse_array_of_filters(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Mismatched filter parameters in array format.",
         )
+    if limit is not None and len(fields) > limit:
+        fields = fields[: limit + 1]
     return [
         _parse_one_filter_at(i, field, operator, value)
         for i, (field, operator, value) in enumerate(zip(fields, operators, values))
     ]
 
 
-def _parse_filters(
+@lru_cache(maxsize=256)
+def _split_search_fields(search_fields_raw: str) -> Tuple[str, ...]:
+    """
+    Split a comma-separated search_fields value into field names.
+
+    Cached because clients tend to reuse a handful of field combinations.
+
+    Args:
+        search_fields_raw: Raw search_fields query parameter
+
+    Returns:
+        Tuple[str, ...]: Non-empty, stripped field names
+    """
+    return tuple(field for field in map(str.strip, search_fields_raw.split(",")) if field)
+
+
+def _contains_any(fields: Tuple[str, ...], value: str) -> OrFilterGroup:
+    """
+    Build an OR group matching ``value`` as a substring of any of ``fields``.
+
+    Args:
+        fields: Field names to search
+        value: Search term
+
+    Returns:
+        OrFilterGroup: One CONTAINS filter per field
+    """
+    return OrFilterGroup(
+        filters=[
+            Filter(field=field, operator=FilterOperator.CONTAINS, value=value) for field in fields
+        ]
+    )
+
+
+# The request parsers below do no I/O, so they are async: FastAPI then runs
+# them inline on the event loop instead of dispatching each to the threadpool.
+async def _parse_filters(
     request: Request,
 ) -> Optional[List[Filter]]:
+    """
+    Parse filters from the request, reading at most one past the default limit.
+
+    See _parse_query_filters() for the supported formats.
+
+    Args:
+        request: FastAPI Request object containing query parameters
+
+    Returns:
+        Optional[List[Filter]]: List of parsed filters or None if no filters;
+            a _TruncatedFilters list if parsing stopped at the limit
+
+    Raises:
+        HTTPException: If a filter is incomplete or invalid
+    """
+    return _parse_query_filters(request.query_params, _DEFAULT_MAX_FILTERS)
+
+
+def _parse_query_filters(query_params: QueryParams, limit: Optional[int]) -> Optional[List[Filter]]:
     """
     Parse filters from query parameters supporting two formats:
     1. Indexed format:
@@ -95,25 +175,42 @@ def _parse_filters(
     2. Simple format:
        ?field=age&operator=gte&value=18&field=name&operator=ilike&value=joy
 
+    Parsing stops once more than ``limit`` filters have been read, so an
+    oversized query string is never fully validated; such a list is returned
+    as _TruncatedFilters and rejected against ``FSPConfig.max_filters``.
+
     Args:
-        request: FastAPI Request object containing query parameters
+        query_params: Query parameters of the request
+        limit: Maximum number of filters, None for unlimited
 
     Returns:
         Optional[List[Filter]]: List of parsed filters or None if no filters
+
+    Raises:
+        HTTPException: If a filter is incomplete or invalid
     """
-    query_params = request.query_params
     filters = []
 
+    # One pass over the params collects both formats: indexed keys are bucketed
+    # by index, simple-format keys are gathered in order as getlist() would
+    buckets: Dict[int, List[Optional[str]]] = {}
+    simple: Dict[str, List[str]] = {"field": [], "operator": [], "value": []}
+    for key, param in query_params.multi_items():
+        if not key.startswith("filters["):
+            if (values := simple.get(key)) is not None:
+                values.append(param)
+            continue
+        match = _INDEXED_FILTER_KEY(key)
+        if match is not None:
+            # Later duplicates win, as with query_params.get()
+            parts = buckets.setdefault(int(match[1]), [None, None, None])
+            parts[_INDEXED_FILTER_PART[match[2]]] = param
+
     # Try indexed format first: filters[0][field], filters[0][operator], etc.
-    i = 0
-    while True:
-        field_key = f"filters[{i}][field]"
-        operator_key = f"filters[{i}][operator]"
-        value_key = f"filters[{i}][value]"
 
-        field = query_params.get(field_key)
-        operator = query_params.get(operator_key)
-        value = query_params.get(value_key)
+    i = 0
+    while (parts := buckets.get(i)) is not None:
+        field, operator, value = parts
 
         # If we don't have a field at this index, break the loop
         if field is None:
@@ -128,17 +225,17 @@ def _parse_filters(
 
         filters.append(_parse_one_filter_at(i, field, operator, value))
         i += 1
+        if limit is not None and i > limit:
+            return _TruncatedFilters(filters)
 
     # If we found indexed filters, return them
     if filters:
         return filters
 
     # Fall back to simple format: field, operator, value
-    filters = _parse_array_of_filters(
-        query_params.getlist("field"),
-        query_params.getlist("operator"),
-        query_params.getlist("value"),
-    )
+    filters = _parse_array_of_filters(simple["field"], simple["operator"], simple["value"], limit)
+    if limit is not None and len(filters) > limit:
+        return _TruncatedFilters(filters)
     if filters:
         return filters
 
@@ -146,7 +243,7 @@ def _parse_filters(
     return None
 
 
-def _parse_search(
+async def _parse_search(
     request: Request,
 ) -> Optional[List[OrFilterGroup]]:
     """
@@ -184,7 +281,7 @@ def _parse_search(
             "Specify comma-separated field names, e.g. search_fields=name,email",
         )
 
-    fields = [f.strip() for f in search_fields_raw.split(",") if f.strip()]
+    fields = _split_search_fields(search_fields_raw)
     if not fields:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -207,23 +304,12 @@ def _parse_search(
         tokens = search.split()
         if not tokens:
             return None
-        return [
-            OrFilterGroup(
-                filters=[
-                    Filter(field=field, operator=FilterOperator.CONTAINS, value=token)
-                    for field in fields
-                ]
-            )
-            for token in tokens
-        ]
+        return [_contains_any(fields, token) for token in tokens]
 
-    filters = [
-        Filter(field=field, operator=FilterOperator.CONTAINS, value=search) for field in fields
-    ]
-    return [OrFilterGroup(filters=filters)]
+    return [_contains_any(fields, search)]
 
 
-def _parse_sort(
+async def _parse_sort(
     sort_by: Optional[str] = Query(None, alias="sort_by"),
     order: Optional[SortingOrder] = Query(SortingOrder.ASC, alias="order"),
 ) -> Optional[SortingQuery]:
@@ -242,7 +328,7 @@ def _parse_sort(
     return SortingQuery(sort_by=sort_by, order=order)
 
 
-def _parse_pagination(
+async def _parse_pagination(
     page: Optional[int] = Query(1, ge=1, description="Page number"),
     per_page: Optional[int] = Query(10, ge=1, le=100, description="Items per page"),
 ) -> PaginationQuery:
@@ -259,6 +345,58 @@ def _parse_pagination(
     return PaginationQuery(page=page, per_page=per_page)
 
 
+@lru_cache(maxsize=256)
+def _model_columns(model: Type[SQLModel]) -> ColumnCollection[str, ColumnElement[Any]]:
+    """
+    Get the selected columns of ``select(model)``, cached per model class.
+
+    The column collection of a single-entity select depends only on the model,
+    so from_model() reuses it instead of rebuilding it on every request.
+
+    Args:
+        model: SQLModel class
+
+    Returns:
+        ColumnCollection: Column map of ``select(model)``
+    """
+    return select(model).selected_columns
+
+
+@lru_cache(maxsize=None)
+def _shared_filter_engine(strict_mode: bool, search_backend: str) -> FilterEngine:
+    """
+    Get the process-wide FilterEngine for a configuration.
+
+    FilterEngine holds no per-request state, so FSPManager instances share one
+    engine per (strict_mode, search_backend) instead of building one per request.
+    Shared engines must not be mutated.
+
+    Args:
+        strict_mode: If True, raise errors for unknown fields
+        search_backend: Search backend name (a SearchBackend value)
+
+    Returns:
+        FilterEngine: Shared engine
+    """
+    engine = FilterEngine(strict_mode=strict_mode)
+    engine.search_backend = search_backend
+    return engine
+
+
+@lru_cache(maxsize=None)
+def _shared_sort_engine(strict_mode: bool) -> SortEngine:
+    """
+    Get the process-wide SortEngine for a strict_mode setting.
+
+    Args:
+        strict_mode: If True, raise errors for unknown sort fields
+
+    Returns:
+        SortEngine: Shared engine
+    """
+    return SortEngine(strict_mode=strict_mode)
+
+
 class FSPManager:
     """
     FastAPI Filtering, Sorting, and Pagination Manager.
@@ -301,10 +439,17 @@ class FSPManager:
         self.or_filters = or_filters
         self.sorting = sorting
         self.pagination = pagination
+        # Only filters from the request count toward max_filters, not with_filters() ones
+        self._max_filters = _DEFAULT_MAX_FILTERS
+        self._request_filter_count = len(filters) if filters else 0
+        # Limit at which the request parser stopped, if it did
+        self._filters_truncated_at = (
+            _DEFAULT_MAX_FILTERS if isinstance(filters, _TruncatedFilters) else None
+        )
 
         # Initialize engines
-        self._filter_engine = FilterEngine(strict_mode=strict_mode)
-        self._sort_engine = SortEngine(strict_mode=strict_mode)
+        self._filter_engine = _shared_filter_engine(strict_mode, "ilike")
+        self._sort_engine = _shared_sort_engine(strict_mode)
         self._pagination_engine = PaginationEngine(
             pagination=pagination,
             request=request,
@@ -319,13 +464,9 @@ class FSPManager:
     @strict_mode.setter
     def strict_mode(self, value: bool) -> None:
         """Set strict mode on all engines."""
-        self._filter_engine.strict_mode = value
-        self._sort_engine.strict_mode = value
-
-    @property
-    def _type_cache(self) -> dict:
-        """Backward-compatible access to filter engine type cache."""
-        return self._filter_engine._type_cache
+        # Engines are shared between managers, so swap them rather than mutate
+        self._filter_engine = _shared_filter_engine(value, self._filter_engine.search_backend)
+        self._sort_engine = _shared_sort_engine(value)
 
     def _get_column_type(self, column: ColumnElement[Any]) -> Optional[type]:
         """
@@ -398,9 +539,16 @@ class FSPManager:
         Returns:
             PaginatedResponse: Complete paginated response
         """
-        columns_map = query.selected_columns
-        query = self._apply_filters(query, columns_map, self.filters)
-        query = self._apply_or_filters(query, columns_map, self.or_filters)
+        return self._generate_response(query, session, query.selected_columns)
+
+    def _generate_response(
+        self,
+        query: Select,
+        session: Session,
+        columns_map: ColumnCollection[str, ColumnElement[Any]],
+    ) -> PaginatedResponse[Any]:
+        """Generate a paginated response using an already-resolved column map."""
+        query = self._apply_all(query, columns_map)
         query = self._apply_sort(query, columns_map, self.sorting)
 
         data_page, total_items = self._pagination_engine.paginate_with_count(query, session)
@@ -425,9 +573,16 @@ class FSPManager:
         Returns:
             PaginatedResponse: Complete paginated response
         """
-        columns_map = query.selected_columns
-        query = self._apply_filters(query, columns_map, self.filters)
-        query = self._apply_or_filters(query, columns_map, self.or_filters)
+        return await self._generate_response_async(query, session, query.selected_columns)
+
+    async def _generate_response_async(
+        self,
+        query: Select,
+        session: AsyncSession,
+        columns_map: ColumnCollection[str, ColumnElement[Any]],
+    ) -> PaginatedResponse[Any]:
+        """Generate a paginated response asynchronously using an already-resolved column map."""
+        query = self._apply_all(query, columns_map)
         query = self._apply_sort(query, columns_map, self.sorting)
 
         data_page, total_items = await self._pagination_engine.paginate_with_count_async(
@@ -441,6 +596,78 @@ class FSPManager:
             sorting=self.sorting,
         )
 
+    def generate_keyset_response(
+        self,
+        query: Select,
+        session: Session,
+        key_columns: Sequence[ColumnElement[Any]],
+        descending: bool = False,
+    ) -> PaginatedResponse[Any]:
+        """
+        Generate a paginated response using keyset (cursor) pagination.
+
+        Filters and search are applied as usual; the order comes from
+        ``key_columns`` (which must be unique together and non-null), so the
+        ``sort_by`` parameter is not applied. The page position is read from
+        the ``cursor`` query parameter and ``links.next`` carries the next one.
+        No count query is issued.
+
+        Args:
+            query: Base SQLAlchemy Select query
+            session: Database session
+            key_columns: Columns defining the order, e.g. ``[Hero.id]``
+            descending: If True, walk the key columns in descending order
+
+        Returns:
+            PaginatedResponse: Complete paginated response
+
+        Raises:
+            HTTPException: If the cursor is invalid
+        """
+        query = self._apply_all(query, query.selected_columns)
+        data_page, next_cursor = self._pagination_engine.paginate_keyset(
+            query, session, key_columns, self.request.query_params.get("cursor"), descending
+        )
+        return self._pagination_engine.build_keyset_response(
+            data_page=data_page,
+            next_cursor=next_cursor,
+            filters=self.filters,
+            or_filters=self.or_filters,
+        )
+
+    async def generate_keyset_response_async(
+        self,
+        query: Select,
+        session: AsyncSession,
+        key_columns: Sequence[ColumnElement[Any]],
+        descending: bool = False,
+    ) -> PaginatedResponse[Any]:
+        """
+        Generate a paginated response using keyset (cursor) pagination asynchronously.
+
+        Args:
+            query: Base SQLAlchemy Select query
+            session: Async database session
+            key_columns: Columns defining the order, e.g. ``[Hero.id]``
+            descending: If True, walk the key columns in descending order
+
+        Returns:
+            PaginatedResponse: Complete paginated response
+
+        Raises:
+            HTTPException: If the cursor is invalid
+        """
+        query = self._apply_all(query, query.selected_columns)
+        data_page, next_cursor = await self._pagination_engine.paginate_keyset_async(
+            query, session, key_columns, self.request.query_params.get("cursor"), descending
+        )
+        return self._pagination_engine.build_keyset_response(
+            data_page=data_page,
+            next_cursor=next_cursor,
+            filters=self.filters,
+            or_filters=self.or_filters,
+        )
+
     @staticmethod
     def _coerce_value(column: ColumnElement[Any], raw: str, pytype: Optional[type] = None) -> Any:
         """
@@ -590,6 +817,43 @@ class FSPManager:
             )
         return self._filter_engine.apply_or_filter_groups(query, columns_map, or_filters)
 
+    def _apply_all(
+        self, query: Select, columns_map: ColumnCollection[str, ColumnElement[Any]]
+    ) -> Select:
+        """
+        Apply this manager's AND filters and OR groups to a query.
+
+        Args:
+            query: Base SQLAlchemy Select query
+            columns_map: Map of column names to column elements
+
+        Returns:
+            Select: Query with all filters applied
+
+        Raises:
+            HTTPException: If the request sent more filters than max_filters allows,
+                or strict_mode is True and an unknown field is encountered
+        """
+        limit = self._max_filters
+        if limit is not None and self._request_filter_count > limit:
+            raise _too_many_filters(limit)
+        return self._filter_engine.apply_all(query, columns_map, self.filters, self.or_filters)
+
+    def _reparse_request_filters(self, limit: Optional[int]) -> None:
+        """
+        Re-read the request filters under a higher limit than the parser used.
+
+        Filters added with with_filters() follow the request filters and are kept.
+
+        Args:
+            limit: New maximum number of request filters, None for unlimited
+        """
+        parsed = _parse_query_filters(self.request.query_params, limit) or []
+        added = (self.filters or [])[self._request_filter_count :]
+        self.filters = [*parsed, *added] or None
+        self._request_filter_count = len(parsed)
+        self._filters_truncated_at = limit if isinstance(parsed, _TruncatedFilters) else None
+
     def _apply_sort(
         self,
         query: Select,
@@ -624,12 +888,21 @@ class FSPManager:
         Returns:
             FSPManager: Self for chaining
         """
-        self.strict_mode = config.strict_mode
+        self._filter_engine = _shared_filter_engine(config.strict_mode, config.search_backend.value)
+        self._sort_engine = _shared_sort_engine(config.strict_mode)
         # Validate and constrain pagination values
         self.pagination.page = config.validate_page(self.pagination.page)
         self.pagination.per_page = config.validate_per_page(self.pagination.per_page)
-        # Search backend settings
-        self._filter_engine.search_backend = config.search_backend.value
+        self._pagination_engine.count_cache = config.count_cache
+        self._pagination_engine.use_late_row_lookup = config.late_row_lookup
+        self._pagination_engine.approximate_count = config.approximate_count
+        self._pagination_engine.count_sample_percent = config.count_sample_percent
+        self._max_filters = config.max_filters
+        truncated_at = self._filters_truncated_at
+        if truncated_at is not None and (
+            config.max_filters is None or config.max_filters > truncated_at
+        ):
+            self._reparse_request_filters(config.max_filters)
         if self.or_filters and len(self.or_filters) > config.max_search_tokens:
             self.or_filters = self.or_filters[: config.max_search_tokens]
         return self
@@ -659,8 +932,7 @@ class FSPManager:
             ):
                 return fsp.from_model(Hero, session)
         """
-        query = select(model)
-        return self.generate_response(query, session)
+        return self._generate_response(select(model), session, _model_columns(model))
 
     async def from_model_async(
         self,
@@ -687,12 +959,15 @@ class FSPManager:
             ):
                 return await fsp.from_model_async(Hero, session)
         """
-        query = select(model)
-        return await self.generate_response_async(query, session)
+        return await self._generate_response_async(select(model), session, _model_columns(model))
 
     def with_filters(self, filters: Optional[List[Filter]]) -> "FSPManager":
         """
-        Set or override filters.
+        Set or append filters.
+
+        When no filters are set yet, ``filters`` is stored as-is (not copied).
+        Appending builds a new list, so a list passed in earlier is never
+        mutated.
 
         Args:
             filters: List of filters to apply
@@ -702,15 +977,33 @@ class FSPManager:
         """
         if filters:
             if self.filters:
-                self.filters.extend(filters)
+                self.filters = [*self.filters, *filters]
             else:
                 self.filters = filters
         return self
 
+    def with_filters_replace(self, filters: Optional[List[Filter]]) -> "FSPManager":
+        """
+        Replace all filters, including those parsed from the request.
+
+        Args:
+            filters: List of filters to apply, or None to clear them
+
+        Returns:
+            FSPManager: Self for chaining
+        """
+        self.filters = filters or None
+        self._request_filter_count = 0
+        self._filters_truncated_at = None
+        return self
+
     def with_or_filters(self, or_filters: Optional[List[OrFilterGroup]]) -> "FSPManager":
         """
         Set or append OR filter groups.
 
+        Like with_filters(), the first list is stored as-is and appending
+        builds a new list.
+
         Args:
             or_filters: List of OR filter groups to apply
 
@@ -719,7 +1012,7 @@ class FSPManager:
         """
         if or_filters:
             if self.or_filters:
-                self.or_filters.extend(or_filters)
+                self.or_filters = [*self.or_filters, *or_filters]
             else:
                 self.or_filters = or_filters
         return self
@@ -1,13 +1,21 @@
 """Pagination engine with optional PostgreSQL window function optimization."""
 
-from math import ceil
-from typing import Any, Optional, Tuple
-
-from fastapi import Request
-from sqlalchemy import Select, func, over
-from sqlmodel import Session
+import base64
+import binascii
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy import ColumnElement, Select, Table, func, over, tablesample, tuple_
+from sqlalchemy.sql.util import ClauseAdapter
+from sqlmodel import Session, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from fastapi_fsp.filters import FilterEngine, _coerce_value
 from fastapi_fsp.models import (
     Links,
     Meta,
@@ -17,6 +25,26 @@ from fastapi_fsp.models import (
 )
 
 
+def _page_link_formatter(url: Any, per_page: int) -> Callable[[int], str]:
+    """
+    Build a formatter producing pagination links for the given request URL.
+
+    Equivalent to ``url.include_query_params(page=..., per_page=...)`` but the
+    query string is re-encoded only once, instead of once per link.
+
+    Args:
+        url: Request URL (starlette ``URL``)
+        per_page: Items per page to embed in every link
+
+    Returns:
+        Callable mapping a page number to its absolute link
+    """
+    base = url.remove_query_params(("page", "per_page"))
+    prefix = f"{base}{'&' if base.query else '?'}page="
+    suffix = f"&per_page={per_page}"
+    return lambda page: f"{prefix}{page}{suffix}"
+
+
 def _detect_postgresql(session: Any) -> bool:
     """
     Detect if the session is connected to a PostgreSQL database.
@@ -42,6 +70,330 @@ def _detect_postgresql(session: Any) -> bool:
     return False
 
 
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the key values of a row into an opaque keyset pagination cursor.
+
+    Args:
+        values: Key column values of the last row of a page
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    raw = json.dumps(list(values), default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, key_columns: Sequence[ColumnElement[Any]]) -> List[Any]:
+    """
+    Decode a keyset pagination cursor into values typed for the key columns.
+
+    Args:
+        cursor: Cursor produced by encode_cursor()
+        key_columns: Key columns the cursor was built from
+
+    Returns:
+        List[Any]: One value per key column
+
+    Raises:
+        HTTPException: If the cursor is malformed or does not match the key columns
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        values = None
+    if not isinstance(values, list) or len(values) != len(key_columns):
+        raise _invalid_cursor()
+    decoded = []
+    for col, value in zip(key_columns, values):
+        if value is None:
+            decoded.append(None)
+            continue
+        if not isinstance(value, _CURSOR_SCALARS):
+            raise _invalid_cursor()
+        pytype = FilterEngine.get_column_type(col)
+        try:
+            value = _coerce_value(col, value, pytype)
+        except (TypeError, ValueError, AttributeError):
+            raise _invalid_cursor() from None
+        # _coerce_value hands back the raw value when it cannot be converted
+        if pytype is not None and not isinstance(value, pytype):
+            raise _invalid_cursor()
+        decoded.append(value)
+    return decoded
+
+
+# JSON scalars a cursor may carry; nested lists/objects are never produced by encode_cursor
+_CURSOR_SCALARS = (str, int, float, bool)
+
+
+def _invalid_cursor() -> HTTPException:
+    """Build the 400 error raised for malformed or tampered cursors."""
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid pagination cursor.",
+    )
+
+
+class CountCache:
+    """
+    Opt-in TTL cache for pagination count queries.
+
+    Counting is usually the most expensive query of a paginated request. When
+    clients page through the same filtered result set, the total can be served
+    from this cache instead of issuing ``SELECT count(*)`` again. Entries are
+    keyed by the compiled count SQL and its parameters.
+
+    Totals may be stale for up to ``ttl`` seconds after writes; call
+    invalidate() after bulk changes. Use one cache per database.
+
+    Example:
+        count_cache = CountCache(ttl=30)
+        config = FSPConfig(count_cache=count_cache)
+        ...
+        count_cache.invalidate()  # after inserting or deleting rows
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024):
+        """
+        Initialize CountCache.
+
+        Args:
+            ttl: Seconds a cached total stays valid
+            maxsize: Maximum number of cached totals (least recently used are evicted)
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, Tuple[float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(query: Select) -> bytes:
+        """
+        Build the cache key for a count query.
+
+        Args:
+            query: Count query to execute
+
+        Returns:
+            bytes: Digest of the compiled SQL and its bound parameters
+        """
+        compiled = query.compile()
+        params = sorted(compiled.params.items())
+        return hashlib.blake2b(f"{compiled}\0{params!r}".encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[int]:
+        """
+        Get a cached total.
+
+        Args:
+            key: Key from key_for()
+
+        Returns:
+            Optional[int]: Cached total, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, total = entry
+            if expires_at <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return total
+
+    def set(self, key: bytes, total: int) -> None:
+        """
+        Cache a total.
+
+        Args:
+            key: Key from key_for()
+            total: Total count to cache
+        """
+        with self._lock:
+            self._entries[key] = (monotonic() + self.ttl, total)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached totals."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached totals, including expired ones not yet evicted."""
+        return len(self._entries)
+
+
+def _count_query(query: Select) -> Select:
+    """
+    Turn a select into a ``SELECT count(*)`` of its rows, without ORDER BY.
+
+    The projection is replaced in place so the database can count from an
+    index. DISTINCT, GROUP BY and LIMIT/OFFSET/FETCH change what a row is, so those
+    queries are counted through a subquery instead.
+
+    Args:
+        query: SQLAlchemy Select query
+
+    Returns:
+        Select: Count query
+    """
+    query = query.order_by(None)
+    if (
+        query._distinct
+        or query._group_by_clauses
+        or query._limit_clause is not None
+        or query._offset_clause is not None
+        or query._fetch_clause is not None
+    ):
+        return select(func.count()).select_from(query.subquery())
+    return query.with_only_columns(func.count(), maintain_column_froms=True)
+
+
+def _explain_statement(query: Select, dialect: Any) -> Tuple[str, Any]:
+    """
+    Build a driver-level ``EXPLAIN (FORMAT JSON)`` statement for a query.
+
+    Args:
+        query: SQLAlchemy Select query with filters applied
+        dialect: Dialect of the connection that will run the statement
+
+    Returns:
+        Tuple[str, Any]: SQL string and parameters in the driver's paramstyle
+    """
+    # Expanding IN binds must be rendered inline; the driver never sees
+    # SQLAlchemy's __[POSTCOMPILE_x] placeholders otherwise
+    compiled = query.order_by(None).compile(
+        dialect=dialect, compile_kwargs={"render_postcompile": True}
+    )
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    return f"EXPLAIN (FORMAT JSON) {compiled.string}", params
+
+
+def _sampled_count_query(query: Select, percent: float) -> Optional[Select]:
+    """
+    Build a count over a ``TABLESAMPLE SYSTEM`` sample of the query's table.
+
+    The WHERE clause is carried over onto the sampled table, so the result
+    scaled by ``100 / percent`` estimates the filtered total.
+
+    Args:
+        query: SQLAlchemy Select query with filters applied
+        percent: Percentage of the table's pages to sample
+
+    Returns:
+        Optional[Select]: The sampled count query, or None for queries over
+            joins, with DISTINCT/GROUP BY, or with their own LIMIT/OFFSET/FETCH
+    """
+    if (
+        query._distinct
+        or query._group_by_clauses
+        or query._limit_clause is not None
+        or query._offset_clause is not None
+        or query._fetch_clause is not None
+    ):
+        return None
+    froms = query.get_final_froms()
+    if len(froms) != 1 or not isinstance(froms[0], Table):
+        return None
+
+    table = froms[0]
+    sampled = tablesample(table, func.system(percent), name=table.name)
+    adapter = ClauseAdapter(sampled)
+    return (
+        select(func.count())
+        .select_from(sampled)
+        .where(*(adapter.traverse(criterion) for criterion in query._where_criteria))
+    )
+
+
+def _plan_rows(plan: Any) -> int:
+    """
+    Read the planner's row estimate from ``EXPLAIN (FORMAT JSON)`` output.
+
+    Args:
+        plan: The JSON plan, already decoded or as a string depending on the driver
+
+    Returns:
+        int: Estimated number of rows
+    """
+    if isinstance(plan, (str, bytes)):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _strip_total_count(rows: Sequence[Any]) -> List[Any]:
+    """
+    Drop the trailing ``_total_count`` window column from result rows.
+
+    Single-entity rows are unwrapped to the entity; multi-column rows become
+    dicts keyed by column name, with the names read once from the first row.
+
+    Args:
+        rows: Non-empty rows from the window function query
+
+    Returns:
+        List[Any]: Page data
+    """
+    keys = rows[0]._fields[:-1]
+    if len(keys) == 1:
+        return [row[0] for row in rows]
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def _late_row_lookup_query(query: Select, offset: int, limit: int) -> Optional[Select]:
+    """
+    Rewrite an offset page as a "late row lookup" on the primary key.
+
+    The OFFSET/LIMIT scan runs in a subquery that selects only the primary key,
+    and the full rows are then joined in for the page alone:
+
+        SELECT t.* FROM t
+        JOIN (SELECT t.id FROM t WHERE ... ORDER BY ... LIMIT :n OFFSET :o) AS anon
+            ON t.id = anon.id
+        ORDER BY ...
+
+    Args:
+        query: SQLAlchemy Select query (with filters/sort already applied)
+        offset: Number of rows to skip
+        limit: Page size
+
+    Returns:
+        Optional[Select]: The rewritten query, or None when it does not apply
+            (first page, joins, composite keys, DISTINCT/GROUP BY or an
+            existing LIMIT/OFFSET/FETCH).
+    """
+    if (
+        offset <= 0
+        or query._distinct
+        or query._group_by_clauses
+        or query._limit_clause is not None
+        or query._offset_clause is not None
+        or query._fetch_clause is not None
+    ):
+        return None
+    froms = query.get_final_froms()
+    if len(froms) != 1 or not isinstance(froms[0], Table):
+        return None
+    pk_columns = froms[0].primary_key.columns
+    if len(pk_columns) != 1:
+        return None
+
+    pk = next(iter(pk_columns))
+    ids = query.with_only_columns(pk).offset(offset).limit(limit).subquery()
+    return query.join(ids, pk == ids.c[0])
+
+
 class PaginationEngine:
     """
     Engine for paginating queries and building paginated responses.
@@ -59,6 +411,10 @@ class PaginationEngine:
         pagination: PaginationQuery,
         request: Request,
         use_window_function: Optional[bool] = None,
+        count_cache: Optional[CountCache] = None,
+        use_late_row_lookup: bool = False,
+        approximate_count: bool = False,
+        count_sample_percent: Optional[float] = None,
     ):
         """
         Initialize PaginationEngine.
@@ -68,10 +424,30 @@ class PaginationEngine:
             request: FastAPI Request object (for building HATEOAS links)
             use_window_function: Force window function usage on/off.
                 None = auto-detect based on database dialect (enabled for PostgreSQL).
+            count_cache: Optional cache for count query results. Only used by the
+                separate count query, not by the window function path.
+            use_late_row_lookup: Apply OFFSET/LIMIT to a primary-key-only subquery
+                and join the full rows in afterwards. Only used by paginate(), for
+                single-table queries with a single-column primary key.
+            approximate_count: On PostgreSQL, take total_items from the planner's
+                row estimate (``EXPLAIN``) instead of running ``count(*)``.
+            count_sample_percent: On PostgreSQL, estimate totals by counting a
+                ``TABLESAMPLE SYSTEM`` sample of this percentage of single-table
+                queries. Falls back to ``EXPLAIN`` (if approximate_count is set)
+                or to an exact count when the query or the sample cannot be used.
+
+        Raises:
+            ValueError: If count_sample_percent is not in (0, 100]
         """
+        if count_sample_percent is not None and not 0 < count_sample_percent <= 100:
+            raise ValueError("count_sample_percent must be in (0, 100]")
         self.pagination = pagination
         self.request = request
         self.use_window_function = use_window_function
+        self.count_cache = count_cache
+        self.use_late_row_lookup = use_late_row_lookup
+        self.approximate_count = approximate_count
+        self.count_sample_percent = count_sample_percent
 
     def _should_use_window_function(self, session: Any) -> bool:
         """Determine whether to use window function optimization."""
@@ -79,6 +455,50 @@ class PaginationEngine:
             return self.use_window_function
         return _detect_postgresql(session)
 
+    def _should_estimate_count(self, session: Any) -> bool:
+        """Determine whether totals are estimated (PostgreSQL only)."""
+        if not self.approximate_count and self.count_sample_percent is None:
+            return False
+        return _detect_postgresql(session)
+
+    @property
+    def _offset(self) -> int:
+        """Rows skipped before the current page (read live; apply_config may change it)."""
+        return (self.pagination.page - 1) * self.pagination.per_page
+
+    def _page_query(self, query: Select) -> Select:
+        """Apply the current page's OFFSET/LIMIT, via a late row lookup if enabled."""
+        offset = self._offset
+        if self.use_late_row_lookup:
+            lookup = _late_row_lookup_query(query, offset, self.pagination.per_page)
+            if lookup is not None:
+                return lookup
+        return query.offset(offset).limit(self.pagination.per_page)
+
+    def _total_from_page(self, data: Sequence[Any]) -> Optional[int]:
+        """
+        Derive the total from a page that is not full, without a count query.
+
+        A short page is the last one, so the total is the offset plus its length.
+        An empty page past the first one says nothing about the total.
+
+        Args:
+            data: Rows of the current page
+
+        Returns:
+            Optional[int]: The total, or None if a count query is needed
+        """
+        offset = self._offset
+        if len(data) < self.pagination.per_page and (data or offset == 0):
+            return offset + len(data)
+        return None
+
+    def _at_least_seen(self, total: int, data: Sequence[Any]) -> int:
+        """Raise a cached or estimated total to cover the rows already fetched."""
+        if data:
+            return max(total, self._offset + len(data))
+        return total
+
     # --- Sync methods ---
 
     def paginate(self, query: Select, session: Session) -> Any:
@@ -92,11 +512,7 @@ class PaginationEngine:
         Returns:
             Any: Query results
         """
-        return session.exec(
-            query.offset((self.pagination.page - 1) * self.pagination.per_page).limit(
-                self.pagination.per_page
-            )
-        ).all()
+        return session.exec(self._page_query(query)).all()
 
     def count_total(self, query: Select, session: Session) -> int:
         """
@@ -107,17 +523,57 @@ class PaginationEngine:
             session: Database session
 
         Returns:
-            int: Total count of items
+            int: Total count of items (an estimate if approximate_count or
+                count_sample_percent is set)
+        """
+        if self._should_estimate_count(session):
+            total = self._estimate_total(query, session)
+            if total is not None:
+                return total
+
+        if self.count_cache is None:
+            return self._count_total_static(query, session)
+
+        key = self.count_cache.key_for(_count_query(query))
+        total = self.count_cache.get(key)
+        if total is None:
+            total = self._count_total_static(query, session)
+            self.count_cache.set(key, total)
+        return total
+
+    def _estimate_total(self, query: Select, session: Session) -> Optional[int]:
         """
-        return self._count_total_static(query, session)
+        Estimate the total from a table sample or the planner's row estimate.
+
+        Args:
+            query: SQLAlchemy Select query with filters applied
+            session: Database session (PostgreSQL)
+
+        Returns:
+            Optional[int]: The estimate, or None if an exact count is needed
+        """
+        if self.count_sample_percent is not None:
+            sampled = _sampled_count_query(query, self.count_sample_percent)
+            if sampled is not None:
+                return self._scale_sample(session.exec(sampled).one())
+            if not self.approximate_count:
+                return None
+
+        connection = session.connection()
+        sql, params = _explain_statement(query, connection.dialect)
+        return _plan_rows(connection.exec_driver_sql(sql, params).scalar_one())
+
+    def _scale_sample(self, sample: int) -> Optional[int]:
+        """Scale a sampled count to the full table; None if nothing was sampled."""
+        # An empty sample says nothing about rare matches, so count exactly
+        if not sample:
+            return None
+        return round(sample * 100 / self.count_sample_percent)
 
     @staticmethod
     def _count_total_static(query: Select, session: Session) -> int:
         """Static count method for backward compatibility with FSPManager."""
-        count_query = query.with_only_columns(func.count(), maintain_column_froms=True).order_by(
-            None
-        )
-        return session.exec(count_query).one()
+        return session.exec(_count_query(query)).one()
 
     def paginate_with_count(self, query: Select, session: Session) -> Tuple[Any, int]:
         """
@@ -125,7 +581,8 @@ class PaginationEngine:
 
         When using PostgreSQL with window function optimization enabled, this
         executes a single query with ``COUNT(*) OVER()`` to get both the page
-        data and total count. Otherwise, falls back to separate count + paginate.
+        data and total count. Otherwise, falls back to separate paginate + count,
+        skipping the count query when a partial page already shows the total.
 
         Args:
             query: SQLAlchemy Select query (with filters/sort already applied)
@@ -134,11 +591,13 @@ class PaginationEngine:
         Returns:
             Tuple[Any, int]: (page_data, total_count)
         """
-        if self._should_use_window_function(session):
+        if self._should_use_window_function(session) and not self._should_estimate_count(session):
             return self._paginate_with_window(query, session)
 
-        total = self.count_total(query, session)
         data = self.paginate(query, session)
+        total = self._total_from_page(data)
+        if total is None:
+            total = self._at_least_seen(self.count_total(query, session), data)
         return data, total
 
     def _paginate_with_window(self, query: Select, session: Session) -> Tuple[Any, int]:
@@ -159,22 +618,15 @@ class PaginationEngine:
         """
         total_count_col = over(func.count()).label("_total_count")
         window_query = (
-            query.add_columns(total_count_col)
-            .offset((self.pagination.page - 1) * self.pagination.per_page)
-            .limit(self.pagination.per_page)
+            query.add_columns(total_count_col).offset(self._offset).limit(self.pagination.per_page)
         )
 
         rows = session.execute(window_query).all()
         if not rows:
-            return [], 0
-
-        total = rows[0]._total_count
-        # Strip the _total_count column from each row
-        if len(rows[0]) == 2:
-            data = [row[0] for row in rows]
-        else:
-            data = [{k: v for k, v in row._mapping.items() if k != "_total_count"} for row in rows]
-        return data, total
+            # Past the last page the window has no row to carry the total
+            return [], self.count_total(query, session) if self._offset else 0
+
+        return _strip_total_count(rows), rows[0]._total_count
 
     # --- Async methods ---
 
@@ -189,11 +641,7 @@ class PaginationEngine:
         Returns:
             Any: Query results
         """
-        result = await session.exec(
-            query.offset((self.pagination.page - 1) * self.pagination.per_page).limit(
-                self.pagination.per_page
-            )
-        )
+        result = await session.exec(self._page_query(query))
         return result.all()
 
     async def count_total_async(self, query: Select, session: AsyncSession) -> int:
@@ -205,17 +653,52 @@ class PaginationEngine:
             session: Async database session
 
         Returns:
-            int: Total count of items
+            int: Total count of items (an estimate if approximate_count or
+                count_sample_percent is set)
+        """
+        if self._should_estimate_count(session):
+            total = await self._estimate_total_async(query, session)
+            if total is not None:
+                return total
+
+        if self.count_cache is None:
+            return await self._count_total_async_static(query, session)
+
+        key = self.count_cache.key_for(_count_query(query))
+        total = self.count_cache.get(key)
+        if total is None:
+            total = await self._count_total_async_static(query, session)
+            self.count_cache.set(key, total)
+        return total
+
+    async def _estimate_total_async(self, query: Select, session: AsyncSession) -> Optional[int]:
         """
-        return await self._count_total_async_static(query, session)
+        Async version of _estimate_total.
+
+        Args:
+            query: SQLAlchemy Select query with filters applied
+            session: Async database session (PostgreSQL)
+
+        Returns:
+            Optional[int]: The estimate, or None if an exact count is needed
+        """
+        if self.count_sample_percent is not None:
+            sampled = _sampled_count_query(query, self.count_sample_percent)
+            if sampled is not None:
+                result = await session.exec(sampled)
+                return self._scale_sample(result.one())
+            if not self.approximate_count:
+                return None
+
+        connection = await session.connection()
+        sql, params = _explain_statement(query, connection.dialect)
+        result = await connection.exec_driver_sql(sql, params)
+        return _plan_rows(result.scalar_one())
 
     @staticmethod
     async def _count_total_async_static(query: Select, session: AsyncSession) -> int:
         """Static async count method for backward compatibility with FSPManager."""
-        count_query = query.with_only_columns(func.count(), maintain_column_froms=True).order_by(
-            None
-        )
-        result = await session.exec(count_query)
+        result = await session.exec(_count_query(query))
         return result.one()
 
     async def paginate_with_count_async(
@@ -231,11 +714,13 @@ class PaginationEngine:
         Returns:
             Tuple[Any, int]: (page_data, total_count)
         """
-        if self._should_use_window_function(session):
+        if self._should_use_window_function(session) and not self._should_estimate_count(session):
             return await self._paginate_with_window_async(query, session)
 
-        total = await self.count_total_async(query, session)
         data = await self.paginate_async(query, session)
+        total = self._total_from_page(data)
+        if total is None:
+            total = self._at_least_seen(await self.count_total_async(query, session), data)
         return data, total
 
     async def _paginate_with_window_async(
@@ -253,22 +738,121 @@ class PaginationEngine:
         """
         total_count_col = over(func.count()).label("_total_count")
         window_query = (
-            query.add_columns(total_count_col)
-            .offset((self.pagination.page - 1) * self.pagination.per_page)
-            .limit(self.pagination.per_page)
+            query.add_columns(total_count_col).offset(self._offset).limit(self.pagination.per_page)
         )
 
         result = await session.execute(window_query)
         rows = result.all()
         if not rows:
-            return [], 0
+            return [], await self.count_total_async(query, session) if self._offset else 0
 
-        total = rows[0]._total_count
-        if len(rows[0]) == 2:
-            data = [row[0] for row in rows]
-        else:
-            data = [{k: v for k, v in row._mapping.items() if k != "_total_count"} for row in rows]
-        return data, total
+        return _strip_total_count(rows), rows[0]._total_count
+
+    # --- Keyset pagination ---
+
+    def _keyset_query(
+        self,
+        query: Select,
+        key_columns: Sequence[ColumnElement[Any]],
+        cursor: Optional[str],
+        descending: bool,
+    ) -> Select:
+        """
+        Order by the key columns, seek past the cursor and fetch one extra row.
+
+        Args:
+            query: SQLAlchemy Select query
+            key_columns: Unique, non-null columns defining the order
+            cursor: Cursor from the previous page, or None for the first page
+            descending: If True, walk the key columns in descending order
+
+        Returns:
+            Select: Page query
+        """
+        if not key_columns:
+            raise ValueError("key_columns must contain at least one column")
+        if cursor:
+            values = decode_cursor(cursor, key_columns)
+            if len(key_columns) == 1:
+                key, bound = key_columns[0], values[0]
+            else:
+                key, bound = tuple_(*key_columns), tuple_(*values)
+            query = query.where(key < bound if descending else key > bound)
+        order = [col.desc() if descending else col.asc() for col in key_columns]
+        # One extra row tells whether a next page exists, without counting
+        return query.order_by(None).order_by(*order).limit(self.pagination.per_page + 1)
+
+    def _split_keyset_page(
+        self, rows: Sequence[Any], key_columns: Sequence[ColumnElement[Any]]
+    ) -> Tuple[List[Any], Optional[str]]:
+        """Trim the look-ahead row and build the cursor of the next page."""
+        per_page = self.pagination.per_page
+        data = list(rows[:per_page])
+        if len(rows) <= per_page:
+            return data, None
+        last = data[-1]
+        return data, encode_cursor([getattr(last, col.key) for col in key_columns])
+
+    def paginate_keyset(
+        self,
+        query: Select,
+        session: Session,
+        key_columns: Sequence[ColumnElement[Any]],
+        cursor: Optional[str] = None,
+        descending: bool = False,
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Fetch one page using keyset (seek) pagination instead of OFFSET.
+
+        The database seeks straight past the last row of the previous page, so
+        the cost per page stays flat however deep the client pages. The key
+        columns must be unique together and non-null (e.g. ``(created_at, id)``);
+        they replace any ORDER BY on the query.
+
+        Args:
+            query: SQLAlchemy Select query (with filters applied)
+            session: Database session
+            key_columns: Columns defining the order and the cursor
+            cursor: Cursor from the previous page, or None for the first page
+            descending: If True, walk the key columns in descending order
+
+        Returns:
+            Tuple[List[Any], Optional[str]]: (page_data, next_cursor or None on the last page)
+
+        Raises:
+            HTTPException: If the cursor is invalid
+        """
+        page_query = self._keyset_query(query, key_columns, cursor, descending)
+        rows = session.exec(page_query).all()
+        return self._split_keyset_page(rows, key_columns)
+
+    async def paginate_keyset_async(
+        self,
+        query: Select,
+        session: AsyncSession,
+        key_columns: Sequence[ColumnElement[Any]],
+        cursor: Optional[str] = None,
+        descending: bool = False,
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Async version of paginate_keyset.
+
+        Args:
+            query: SQLAlchemy Select query (with filters applied)
+            session: Async database session
+            key_columns: Columns defining the order and the cursor
+            cursor: Cursor from the previous page, or None for the first page
+            descending: If True, walk the key columns in descending order
+
+        Returns:
+            Tuple[List[Any], Optional[str]]: (page_data, next_cursor or None on the last page)
+
+        Raises:
+            HTTPException: If the cursor is invalid
+        """
+        page_query = self._keyset_query(query, key_columns, cursor, descending)
+        result = await session.exec(page_query)
+        return self._split_keyset_page(result.all(), key_columns)
 
     # --- Response building ---
 
@@ -295,22 +879,14 @@ class PaginationEngine:
         """
         per_page = self.pagination.per_page
         current_page = self.pagination.page
-        total_pages = max(1, ceil(total_items / per_page)) if total_items is not None else 1
-
-        url = self.request.url
-        first_url = str(url.include_query_params(page=1, per_page=per_page))
-        last_url = str(url.include_query_params(page=total_pages, per_page=per_page))
-        next_url = (
-            str(url.include_query_params(page=current_page + 1, per_page=per_page))
-            if current_page < total_pages
-            else None
-        )
-        prev_url = (
-            str(url.include_query_params(page=current_page - 1, per_page=per_page))
-            if current_page > 1
-            else None
-        )
-        self_url = str(url.include_query_params(page=current_page, per_page=per_page))
+        total_pages = max(1, -(-total_items // per_page)) if total_items is not None else 1
+
+        page_url = _page_link_formatter(self.request.url, per_page)
+        first_url = page_url(1)
+        last_url = page_url(total_pages)
+        next_url = page_url(current_page + 1) if current_page < total_pages else None
+        prev_url = page_url(current_page - 1) if current_page > 1 else None
+        self_url = page_url(current_page)
 
         return PaginatedResponse(
             data=data_page,
@@ -333,3 +909,51 @@ class PaginationEngine:
                 prev=prev_url,
             ),
         )
+
+    def build_keyset_response(
+        self,
+        data_page: Any,
+        next_cursor: Optional[str],
+        filters: Any = None,
+        or_filters: Any = None,
+        sorting: Any = None,
+        total_items: Optional[int] = None,
+    ) -> PaginatedResponse[Any]:
+        """
+        Build a paginated response for keyset pagination.
+
+        Links carry a ``cursor`` query parameter instead of ``page``. There is
+        no ``last`` or ``prev`` link, and ``total_pages`` is omitted, since the
+        total is not needed to page forward.
+
+        Args:
+            data_page: Current page of data
+            next_cursor: Cursor of the next page, or None on the last page
+            filters: Active AND filters (for meta)
+            or_filters: Active OR filter groups (for meta)
+            sorting: Active sorting (for meta)
+            total_items: Optional total number of items, if counted separately
+
+        Returns:
+            PaginatedResponse: Final response object
+        """
+        per_page = self.pagination.per_page
+        url = self.request.url.remove_query_params(("page", "cursor"))
+        return PaginatedResponse(
+            data=data_page,
+            meta=Meta(
+                pagination=Pagination(
+                    total_items=total_items,
+                    per_page=per_page,
+                    current_page=self.pagination.page,
+                ),
+                filters=filters,
+                or_filters=or_filters,
+                sort=sorting,
+            ),
+            links=Links(
+                self=str(self.request.url),
+                first=str(url),
+                next=str(url.include_query_params(cursor=next_cursor)) if next_cursor else None,
+            ),
+        )
@@ -1,10 +1,39 @@
 """Common filter presets for frequently used query patterns."""
 
 from datetime import datetime, timedelta
-from typing import List
+from time import monotonic
+from typing import Dict, List, Tuple
 
 from fastapi_fsp.models import Filter, FilterOperator, OrFilterGroup
 
+# days -> (monotonic time computed, ISO cutoff); reused for up to a second
+_CUTOFF_TTL = 1.0
+_now_cutoffs: Dict[int, Tuple[float, str]] = {}
+
+
+def _now_cutoff(days: int) -> str:
+    """Return ``datetime.now() - days`` as ISO 8601, recomputed at most once a second."""
+    now = monotonic()
+    cached = _now_cutoffs.get(days)
+    if cached is not None and now - cached[0] < _CUTOFF_TTL:
+        return cached[1]
+    if len(_now_cutoffs) >= 256:
+        _now_cutoffs.clear()
+    cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+    _now_cutoffs[days] = (now, cutoff)
+    return cutoff
+
+
+def _join_values(values: List) -> str:
+    """Join values into a comma-separated filter value."""
+    if isinstance(values, (list, tuple)):
+        try:
+            # All-string lists (e.g. ids straight from a request) need no conversion
+            return ",".join(values)
+        except TypeError:
+            pass
+    return ",".join(str(v) for v in values)
+
 
 class CommonFilters:
     """
@@ -63,14 +92,16 @@ class CommonFilters:
         Args:
             date_field: Name of the datetime field (default: "created_at")
             days: Number of days to look back (default: 30)
-            reference_time: Reference time for calculation (default: now)
+            reference_time: Reference time for calculation (default: now, cached
+                for up to a second)
 
         Returns:
             List[Filter]: Filters for recent records
         """
         if reference_time is None:
-            reference_time = datetime.now()
-        cutoff = (reference_time - timedelta(days=days)).isoformat()
+            cutoff = _now_cutoff(days)
+        else:
+            cutoff = (reference_time - timedelta(days=days)).isoformat()
         return [Filter(field=date_field, operator=FilterOperator.GTE, value=cutoff)]
 
     @staticmethod
@@ -85,14 +116,16 @@ class CommonFilters:
         Args:
             date_field: Name of the datetime field (default: "created_at")
             days: Number of days threshold (default: 30)
-            reference_time: Reference time for calculation (default: now)
+            reference_time: Reference time for calculation (default: now, cached
+                for up to a second)
 
         Returns:
             List[Filter]: Filters for older records
         """
         if reference_time is None:
-            reference_time = datetime.now()
-        cutoff = (reference_time - timedelta(days=days)).isoformat()
+            cutoff = _now_cutoff(days)
+        else:
+            cutoff = (reference_time - timedelta(days=days)).isoformat()
         return [Filter(field=date_field, operator=FilterOperator.LT, value=cutoff)]
 
     @staticmethod
@@ -110,7 +143,8 @@ class CommonFilters:
             end: End of date range (inclusive)
 
         Returns:
-            List[Filter]: Filters for date range
+            List[Filter]: A single BETWEEN filter when both bounds are given,
+                otherwise a GTE or LTE filter
 
         Raises:
             ValueError: If neither start nor end is provided
@@ -118,16 +152,17 @@ class CommonFilters:
         if start is None and end is None:
             raise ValueError("At least one of start or end must be provided")
 
-        filters = []
+        if start is not None and end is not None:
+            return [
+                Filter(
+                    field=date_field,
+                    operator=FilterOperator.BETWEEN,
+                    value=f"{start.isoformat()},{end.isoformat()}",
+                )
+            ]
         if start is not None:
-            filters.append(
-                Filter(field=date_field, operator=FilterOperator.GTE, value=start.isoformat())
-            )
-        if end is not None:
-            filters.append(
-                Filter(field=date_field, operator=FilterOperator.LTE, value=end.isoformat())
-            )
-        return filters
+            return [Filter(field=date_field, operator=FilterOperator.GTE, value=start.isoformat())]
+        return [Filter(field=date_field, operator=FilterOperator.LTE, value=end.isoformat())]
 
     @staticmethod
     def today(date_field: str = "created_at", reference_time: datetime = None) -> List[Filter]:
@@ -248,7 +283,7 @@ class CommonFilters:
         Returns:
             List[Filter]: IN filter
         """
-        str_values = ",".join(str(v) for v in values)
+        str_values = _join_values(values)
         return [Filter(field=field, operator=FilterOperator.IN, value=str_values)]
 
     @staticmethod
@@ -263,7 +298,7 @@ class CommonFilters:
         Returns:
             List[Filter]: NOT IN filter
         """
-        str_values = ",".join(str(v) for v in values)
+        str_values = _join_values(values)
         return [Filter(field=field, operator=FilterOperator.NOT_IN, value=str_values)]
 
     @staticmethod
@@ -1,6 +1,6 @@
 """Tests for FilterBuilder fluent API."""
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
 
 from fastapi_fsp.builder import FilterBuilder
 from fastapi_fsp.models import Filter, FilterOperator
@@ -150,6 +150,15 @@ class TestFilterBuilder:
 
         assert filters[0].value == "2024-01-15T10:30:00"
 
+    def test_aware_datetime_conversion_keeps_offset(self):
+        """Test equal instants in different time zones keep their own offset."""
+        utc = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        plus_two = utc.astimezone(timezone(timedelta(hours=2)))
+        filters = FilterBuilder().where("a").gte(utc).where("b").gte(plus_two).build()
+
+        assert filters[0].value == "2024-01-15T10:30:00+00:00"
+        assert filters[1].value == "2024-01-15T12:30:00+02:00"
+
     def test_date_conversion(self):
         """Test date value conversion."""
         d = date(2024, 1, 15)
@@ -184,6 +193,48 @@ class TestFilterBuilder:
         assert filters[2].field == "active"
         assert filters[3].field == "score"
 
+    def test_built_filters_match_validated_filters(self):
+        """Test builder output equals and serializes like validated Filter objects."""
+        filters = FilterBuilder().where("age").gte(18).where("name").contains("jo").build()
+
+        assert filters == [
+            Filter(field="age", operator=FilterOperator.GTE, value="18"),
+            Filter(field="name", operator=FilterOperator.CONTAINS, value="jo"),
+        ]
+        assert filters[0].model_dump() == {"field": "age", "operator": "gte", "value": "18"}
+
+    def test_direct_comparison_methods_match_fluent(self):
+        """Test single-call comparison methods build the same filters as where()."""
+        dt = datetime(2024, 1, 15, 10, 30)
+        direct = (
+            FilterBuilder()
+            .eq("active", True)
+            .ne("status", "inactive")
+            .gt("age", 18)
+            .gte("created_at", dt)
+            .lt("price", 99.5)
+            .lte("quantity", 50)
+            .build()
+        )
+        fluent = (
+            FilterBuilder()
+            .where("active")
+            .eq(True)
+            .where("status")
+            .ne("inactive")
+            .where("age")
+            .gt(18)
+            .where("created_at")
+            .gte(dt)
+            .where("price")
+            .lt(99.5)
+            .where("quantity")
+            .lte(50)
+            .build()
+        )
+
+        assert direct == fluent
+
     def test_add_filter_direct(self):
         """Test adding filter directly."""
         builder = FilterBuilder()
@@ -195,6 +246,12 @@ class TestFilterBuilder:
         assert filters[0].operator == FilterOperator.GTE
         assert filters[0].value == "21"
 
+    def test_add_filter_validates_input(self):
+        """Test add_filter still coerces operator strings to FilterOperator."""
+        filters = FilterBuilder().add_filter("age", "gte", "21").build()
+
+        assert filters[0].operator is FilterOperator.GTE
+
     def test_add_filters_bulk(self):
         """Test adding multiple filters at once."""
         existing_filters = [
@@ -218,6 +275,12 @@ class TestFilterBuilder:
         filled_builder = FilterBuilder().where("a").eq(1)
         assert filled_builder
 
+    def test_builders_use_slots(self):
+        """Test builders carry no per-instance __dict__."""
+        builder = FilterBuilder()
+        assert not hasattr(builder, "__dict__")
+        assert not hasattr(builder.where("age"), "__dict__")
+
     def test_in_with_integers(self):
         """Test IN with integer list."""
         filters = FilterBuilder().where("id").in_([1, 2, 3, 4, 5]).build()
@@ -228,6 +291,24 @@ class TestFilterBuilder:
         filters = FilterBuilder().where("flag").in_([True, False]).build()
         assert filters[0].value == "true,false"
 
+    def test_in_with_mixed_types(self):
+        """Test IN with a heterogeneous list and a non-list iterable."""
+        filters = (
+            FilterBuilder()
+            .where("value")
+            .in_([1, "two", True, date(2024, 1, 1)])
+            .where("id")
+            .not_in(v for v in (4, 5))
+            .build()
+        )
+        assert filters[0].value == "1,two,true,2024-01-01"
+        assert filters[1].value == "4,5"
+
+    def test_in_with_string_first_mixed_list(self):
+        """Test IN with a list that starts with a string but is not all strings."""
+        filters = FilterBuilder().where("value").in_(("a", 2, False)).build()
+        assert filters[0].value == "a,2,false"
+
     def test_between_with_dates(self):
         """Test BETWEEN with date values."""
         start = date(2024, 1, 1)
@@ -244,3 +325,31 @@ class TestFilterBuilder:
 
         assert "2024-01-01T00:00:00" in filters[0].value
         assert "2024-12-31T23:59:59" in filters[0].value
+
+    def test_value_subclasses_use_fallback_conversion(self):
+        """Test subclasses of supported types convert like their base type."""
+        from enum import IntEnum, StrEnum
+
+        class Status(StrEnum):
+            ACTIVE = "active"
+
+        class Level(IntEnum):
+            HIGH = 3
+
+        class Stamp(datetime):
+            pass
+
+        filters = (
+            FilterBuilder()
+            .where("status")
+            .eq(Status.ACTIVE)
+            .where("level")
+            .eq(Level.HIGH)
+            .where("created_at")
+            .gte(Stamp(2024, 1, 15, 10, 30))
+            .build()
+        )
+
+        assert filters[0].value == "active"
+        assert filters[1].value == "3"
+        assert filters[2].value == "2024-01-15T10:30:00"
@@ -1,7 +1,10 @@
 """Tests for FSPConfig configuration class."""
 
+from dataclasses import FrozenInstanceError, replace
+
 import pytest
 from fastapi_fsp.config import FSPConfig, FSPPresets
+from fastapi_fsp.pagination import CountCache
 
 
 class TestFSPConfig:
@@ -33,6 +36,21 @@ class TestFSPConfig:
         assert config.strict_mode is True
         assert config.max_page == 100
 
+    def test_config_is_immutable_and_hashable(self):
+        """Test configs are frozen, slotted and usable as cache keys."""
+        config = FSPConfig(max_per_page=50)
+
+        with pytest.raises(FrozenInstanceError):
+            config.max_per_page = 10
+        assert not hasattr(config, "__dict__")
+        assert hash(config) == hash(FSPConfig(max_per_page=50))
+        assert replace(config, strict_mode=True).strict_mode is True
+
+    def test_replace_revalidates(self):
+        """Test dataclasses.replace runs the same validation as the constructor."""
+        with pytest.raises(ValueError, match="default_per_page cannot exceed max_per_page"):
+            replace(FSPConfig(), max_per_page=5)
+
     def test_invalid_max_per_page(self):
         """Test that max_per_page must be >= 1."""
         with pytest.raises(ValueError, match="max_per_page must be >= 1"):
@@ -106,6 +124,170 @@ class TestFSPConfig:
         config = FSPConfig(min_per_page=5, max_per_page=100)
         assert config.validate_per_page(200) == 100
 
+    @pytest.mark.parametrize("percent", [0, 150])
+    def test_invalid_count_sample_percent(self, percent):
+        """Test that count_sample_percent must be in (0, 100]."""
+        with pytest.raises(ValueError, match="count_sample_percent must be in"):
+            FSPConfig(count_sample_percent=percent)
+
+    def test_invalid_max_filters(self):
+        """Test that max_filters must be >= 1 or None."""
+        with pytest.raises(ValueError, match="max_filters must be >= 1 or None"):
+            FSPConfig(max_filters=0)
+
+    def test_apply_config_sets_max_filters(self):
+        """Test the filter limit defaults to 64 and can be raised or lifted by config."""
+        from unittest.mock import Mock
+
+        from fastapi import HTTPException
+        from fastapi_fsp.fsp import FSPManager
+        from fastapi_fsp.models import Filter, FilterOperator, PaginationQuery
+        from sqlmodel import select
+
+        from tests.main import Hero
+
+        filters = [Filter(field="age", operator=FilterOperator.GTE, value="1")] * 65
+        fsp = FSPManager(
+            request=Mock(),
+            filters=filters,
+            sorting=None,
+            pagination=PaginationQuery(page=1, per_page=10),
+            or_filters=None,
+        )
+        query = select(Hero)
+        with pytest.raises(HTTPException, match="at most 64"):
+            fsp._apply_all(query, query.selected_columns)
+
+        fsp.apply_config(FSPConfig(max_filters=100))
+        assert fsp._apply_all(query, query.selected_columns) is not query
+        fsp.apply_config(FSPConfig(max_filters=None))
+        assert fsp._apply_all(query, query.selected_columns) is not query
+        fsp.apply_config(FSPConfig(max_filters=10))
+        with pytest.raises(HTTPException, match="at most 10"):
+            fsp._apply_all(query, query.selected_columns)
+
+    def test_request_filter_parsing_stops_past_limit(self):
+        """Test the parser stops one filter past the limit instead of reading them all."""
+        from fastapi_fsp.fsp import _parse_query_filters, _TruncatedFilters
+        from starlette.datastructures import QueryParams
+
+        simple = QueryParams("&".join(["field=age&operator=gte&value=1"] * 1000))
+        indexed = QueryParams(
+            "&".join(
+                f"filters[{i}][field]=age&filters[{i}][operator]=gte&filters[{i}][value]=1"
+                for i in range(1000)
+            )
+        )
+        for params in (simple, indexed):
+            parsed = _parse_query_filters(params, 64)
+            assert isinstance(parsed, _TruncatedFilters)
+            assert len(parsed) == 65
+            assert len(_parse_query_filters(params, None)) == 1000
+
+    def test_raised_limit_reparses_request_filters(self):
+        """Test raising max_filters re-reads filters cut short by the default limit."""
+        from fastapi_fsp.fsp import FSPManager, _parse_query_filters
+        from fastapi_fsp.models import Filter, FilterOperator, PaginationQuery
+        from sqlmodel import select
+        from starlette.requests import Request
+
+        from tests.main import Hero
+
+        query_string = "&".join(["field=age&operator=gte&value=1"] * 70)
+        request = Request({"type": "http", "query_string": query_string.encode()})
+        extra = Filter(field="name", operator=FilterOperator.EQ, value="x")
+        fsp = FSPManager(
+            request=request,
+            filters=_parse_query_filters(request.query_params, 64),
+            sorting=None,
+            pagination=PaginationQuery(page=1, per_page=10),
+            or_filters=None,
+        ).with_filters([extra])
+        assert len(fsp.filters) == 66
+
+        fsp.apply_config(FSPConfig(max_filters=100))
+        assert len(fsp.filters) == 71
+        assert fsp.filters[-1] is extra
+        query = select(Hero)
+        assert fsp._apply_all(query, query.selected_columns) is not query
+
+    def test_app_added_filters_not_limited(self):
+        """Test filters added with with_filters() do not count toward max_filters."""
+        from unittest.mock import Mock
+
+        from fastapi_fsp.fsp import FSPManager
+        from fastapi_fsp.models import Filter, FilterOperator, PaginationQuery
+        from sqlmodel import select
+
+        from tests.main import Hero
+
+        fsp = FSPManager(
+            request=Mock(),
+            filters=None,
+            sorting=None,
+            pagination=PaginationQuery(page=1, per_page=10),
+            or_filters=None,
+        ).with_filters([Filter(field="age", operator=FilterOperator.GTE, value="1")] * 100)
+        query = select(Hero)
+        assert fsp._apply_all(query, query.selected_columns) is not query
+
+    def test_count_cache_not_part_of_equality(self):
+        """Test configs differing only by count cache compare equal."""
+        assert FSPConfig(count_cache=CountCache()) == FSPConfig()
+
+    def test_apply_config_sets_count_cache(self):
+        """Test apply_config hands the count cache to the pagination engine."""
+        from unittest.mock import Mock
+
+        from fastapi_fsp.fsp import FSPManager
+        from fastapi_fsp.models import PaginationQuery
+
+        cache = CountCache()
+        fsp = FSPManager(
+            request=Mock(),
+            filters=None,
+            sorting=None,
+            pagination=PaginationQuery(page=1, per_page=10),
+            or_filters=None,
+        )
+        fsp.apply_config(FSPConfig(count_cache=cache))
+        assert fsp._pagination_engine.count_cache is cache
+
+    def test_apply_config_sets_late_row_lookup(self):
+        """Test apply_config enables late row lookup on the pagination engine."""
+        from unittest.mock import Mock
+
+        from fastapi_fsp.fsp import FSPManager
+        from fastapi_fsp.models import PaginationQuery
+
+        fsp = FSPManager(
+            request=Mock(),
+            filters=None,
+            sorting=None,
+            pagination=PaginationQuery(page=1, per_page=10),
+            or_filters=None,
+        )
+        assert fsp._pagination_engine.use_late_row_lookup is False
+        fsp.apply_config(FSPConfig(late_row_lookup=True))
+        assert fsp._pagination_engine.use_late_row_lookup is True
+
+    def test_apply_config_sets_approximate_count(self):
+        """Test apply_config enables planner-estimate totals on the pagination engine."""
+        from unittest.mock import Mock
+
+        from fastapi_fsp.fsp import FSPManager
+        from fastapi_fsp.models import PaginationQuery
+
+        fsp = FSPManager(
+            request=Mock(),
+            filters=None,
+            sorting=None,
+            pagination=PaginationQuery(page=1, per_page=10),
+            or_filters=None,
+        )
+        fsp.apply_config(FSPConfig(approximate_count=True))
+        assert fsp._pagination_engine.approximate_count is True
+
 
 class TestFSPPresets:
     """Tests for FSPPresets class."""
@@ -122,6 +304,12 @@ class TestFSPPresets:
         config = FSPPresets.strict()
         assert config.strict_mode is True
 
+    def test_zero_arg_presets_are_shared(self):
+        """Test default and strict presets return a memoized instance."""
+        assert FSPPresets.default() is FSPPresets.default()
+        assert FSPPresets.strict() is FSPPresets.strict()
+        assert FSPPresets.default() is not FSPPresets.strict()
+
     def test_limited_pagination_preset(self):
         """Test limited pagination preset."""
         config = FSPPresets.limited_pagination(max_page=50, max_per_page=25)
@@ -146,3 +334,15 @@ class TestFSPPresets:
         config = FSPPresets.high_volume()
         assert config.max_per_page == 500
         assert config.default_per_page == 100
+
+    def test_parameterized_presets_are_shared_per_arguments(self):
+        """Test parameterized presets return one instance per argument set."""
+        assert FSPPresets.high_volume(max_per_page=300) is FSPPresets.high_volume(max_per_page=300)
+        assert FSPPresets.high_volume(max_per_page=300) is not FSPPresets.high_volume()
+        assert FSPPresets.limited_pagination(10, 20) is FSPPresets.limited_pagination(10, 20)
+
+    def test_parameterized_preset_errors_not_cached(self):
+        """Test invalid arguments raise on every call."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="max_page must be >= 1 or None"):
+                FSPPresets.limited_pagination(max_page=0)
@@ -13,7 +13,7 @@ from fastapi_fsp.filters import (
     _is_string_column,
     _split_values,
 )
-from fastapi_fsp.models import Filter, FilterOperator
+from fastapi_fsp.models import Filter, FilterOperator, OrFilterGroup
 from sqlalchemy import Column as SAColumn
 from sqlalchemy import Enum as SAEnum
 from sqlmodel import Field, SQLModel, create_engine, select
@@ -279,6 +279,22 @@ class TestCustomStrategy:
         FILTER_STRATEGIES[FilterOperator.EQ] = original_eq
 
 
+class TestConditionsOnClonedExpressions:
+    """Tests that conditions follow the expression they are built on."""
+
+    def test_null_check_follows_adapted_expression(self, columns):
+        """A condition on an adapted copy references the copy's table."""
+        from sqlalchemy.sql.util import ClauseAdapter
+
+        f = Filter(field="age", operator=FilterOperator.IS_NULL, value="")
+        expr = columns["age"] * 3
+        assert "filter_test_model.age" in str(FilterEngine.build_filter_condition(expr, f))
+        adapted = ClauseAdapter(FilterTestModel.__table__.alias("h2")).traverse(expr)
+        condition = str(FilterEngine.build_filter_condition(adapted, f))
+        assert "h2.age" in condition
+        assert "filter_test_model.age" not in condition
+
+
 class TestFilterEngineColumnTypeCaching:
     """Tests for FilterEngine column type caching."""
 
@@ -293,8 +309,9 @@ class TestFilterEngineColumnTypeCaching:
         assert pytype2 is int
         assert pytype1 is pytype2
 
-        col_id = id(age_col)
-        assert col_id in engine._type_cache
+        assert age_col.__dict__["_fsp_python_type"] is int
+        # The memoized type is shared with other engines
+        assert FilterEngine().get_column_type(age_col) is int
 
     def test_handles_missing_python_type(self):
         engine = FilterEngine()
@@ -332,6 +349,17 @@ class TestFilterEngineApplyFilters:
         assert "WHERE" in str(result)
         assert "AND" in str(result)
 
+    def test_conditions_ordered_by_operator_cost(self, columns):
+        engine = FilterEngine()
+        query = select(FilterTestModel)
+        filters = [
+            Filter(field="name", operator=FilterOperator.CONTAINS, value="jo"),
+            Filter(field="age", operator=FilterOperator.GTE, value="18"),
+            Filter(field="active", operator=FilterOperator.EQ, value="true"),
+        ]
+        where = str(engine.apply_filters(query, columns, filters)).split("WHERE", 1)[1]
+        assert where.index("active =") < where.index("age >=") < where.index("lower(")
+
     def test_strict_mode_unknown_field(self, columns):
         from fastapi import HTTPException
 
@@ -350,6 +378,65 @@ class TestFilterEngineApplyFilters:
         result = engine.apply_filters(query, columns, filters)
         assert "unknown" not in str(result)
 
+    def test_repeated_field_resolved_once(self, columns, monkeypatch):
+        engine = FilterEngine()
+        lookups = []
+        monkeypatch.setattr(
+            engine, "get_entity_attribute", lambda query, field: lookups.append(field)
+        )
+        query = select(FilterTestModel)
+        filters = [
+            Filter(field="score", operator=FilterOperator.GTE, value="1"),
+            Filter(field="score", operator=FilterOperator.LTE, value="9"),
+            Filter(field="age", operator=FilterOperator.GTE, value="18"),
+            Filter(field="age", operator=FilterOperator.LTE, value="65"),
+        ]
+        result = engine.apply_filters(query, columns, filters)
+        assert lookups == ["score"]
+        assert str(result).count("age") >= 2
+
+
+class TestFilterEngineApplyAll:
+    """Tests for FilterEngine.apply_all()."""
+
+    def test_matches_separate_passes(self, columns):
+        engine = FilterEngine()
+        query = select(FilterTestModel)
+        filters = [Filter(field="age", operator=FilterOperator.GTE, value="18")]
+        or_groups = [
+            OrFilterGroup(
+                filters=[
+                    Filter(field="name", operator=FilterOperator.CONTAINS, value="jo"),
+                    Filter(field="description", operator=FilterOperator.CONTAINS, value="jo"),
+                ]
+            )
+        ]
+        fused = engine.apply_all(query, columns, filters, or_groups)
+        separate = engine.apply_or_filter_groups(
+            engine.apply_filters(query, columns, filters), columns, or_groups
+        )
+        assert str(fused) == str(separate)
+
+    def test_nothing_to_apply_returns_query(self, columns):
+        engine = FilterEngine()
+        query = select(FilterTestModel)
+        assert engine.apply_all(query, columns, None, None) is query
+
+    def test_search_backend_used_for_or_groups(self, columns):
+        engine = FilterEngine()
+        engine.search_backend = "trigram"
+        query = select(FilterTestModel)
+        filters = [Filter(field="age", operator=FilterOperator.GTE, value="18")]
+        or_groups = [
+            OrFilterGroup(filters=[Filter(field="name", operator=FilterOperator.CONTAINS, value=t)])
+            for t in ("jo", "do")
+        ]
+        fused = engine.apply_all(query, columns, filters, or_groups)
+        separate = engine.apply_search_optimized(
+            engine.apply_filters(query, columns, filters), columns, or_groups, "trigram"
+        )
+        assert str(fused) == str(separate)
+
 
 class TestModuleFunctions:
     """Tests for module-level helper functions."""
@@ -378,6 +465,22 @@ class TestModuleFunctions:
         assert _is_string_column(columns["name"]) is True
         assert _is_string_column(columns["age"]) is False
 
+    def test_is_string_column_is_memoized(self, columns):
+        assert _is_string_column(columns["name"]) is True
+        assert columns["name"].__dict__["_fsp_is_string"] is True
+
+    def test_as_text_follows_adapted_expression(self, columns):
+        """A cloned expression is cast from its own columns, not the original's."""
+        from fastapi_fsp.filters import _as_text
+        from sqlalchemy.sql.util import ClauseAdapter
+
+        expr = columns["age"] * 3
+        assert "filter_test_model.age" in str(_as_text(expr))
+        alias = FilterTestModel.__table__.alias("h2")
+        adapted = ClauseAdapter(alias).traverse(expr)
+        assert "h2.age" in str(_as_text(adapted))
+        assert "filter_test_model.age" not in str(_as_text(adapted))
+
     def test_is_string_column_enum_returns_false(self, columns):
         """Enum columns should not be treated as string for ILIKE purposes."""
         assert _is_string_column(columns["status"]) is False
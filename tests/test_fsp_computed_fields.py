@@ -1,10 +1,35 @@
 """Tests for filtering on computed fields (hybrid_property, etc.)."""
 
+from itertools import count
+from typing import ClassVar, Optional
+
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from fastapi_fsp.filters import FilterEngine
+from sqlalchemy import literal
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlmodel import Field, Session, SQLModel, select
 
 from tests.main import Hero
 
+_expression_calls = count()
+
+
+class Ticket(SQLModel, table=True):
+    """Model whose hybrid expression depends on state read at call time."""
+
+    __tablename__ = "computed_fields_ticket"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    generation: ClassVar[int]
+
+    @hybrid_property
+    def generation(self) -> int:
+        return 0
+
+    @generation.expression
+    def generation(cls):
+        return literal(next(_expression_calls))
+
 
 class TestComputedFieldFiltering:
     """Test suite for filtering on computed fields like hybrid_property."""
@@ -219,3 +244,27 @@ class TestComputedFieldFiltering:
         assert meta["filters"][0]["field"] == "full_name"
         assert meta["filters"][0]["operator"] == "eq"
         assert meta["filters"][0]["value"] == "Spider-Man"
+
+
+class TestComputedFieldResolution:
+    """Test resolution of computed fields on the query entity."""
+
+    def test_plain_column_resolved_once_per_entity(self):
+        """Test plain mapped columns are memoized and shared between queries."""
+        first = FilterEngine.get_entity_attribute(select(Hero), "name")
+        second = FilterEngine.get_entity_attribute(select(Hero).where(Hero.age > 1), "name")
+
+        assert first is not None
+        assert first is second
+
+    def test_hybrid_expression_resolved_per_call(self):
+        """Test hybrid expressions are re-evaluated, so runtime state is never frozen."""
+        values = [
+            FilterEngine.get_entity_attribute(select(Ticket), "generation").value for _ in range(3)
+        ]
+
+        assert len(set(values)) == 3
+
+    def test_unknown_attribute_returns_none(self):
+        """Test unknown attributes resolve to None."""
+        assert FilterEngine.get_entity_attribute(select(Hero), "nope") is None
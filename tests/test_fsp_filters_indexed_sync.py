@@ -44,3 +44,41 @@ def test_indexed_incomplete_filter_returns_400(session: Session, client: TestCli
     seed(session)
     r = client.get("/heroes/?filters[0][field]=age&filters[0][operator]=gte")
     assert r.status_code == 400
+
+
+def test_indexed_filters_any_key_order(session: Session, client: TestClient):
+    seed(session)
+    r = client.get(
+        "/heroes/?filters[1][value]=%25eta&filters[0][value]=18&filters[1][field]=name"
+        "&filters[0][operator]=gte&filters[1][operator]=ilike&filters[0][field]=age"
+    )
+    assert r.status_code == 200
+    assert {h["name"] for h in r.json()["data"]} == {"beta"}
+
+
+def test_indexed_filters_stop_at_first_gap(session: Session, client: TestClient):
+    seed(session)
+    # filters[2] is ignored because filters[1] is missing
+    r = client.get(
+        "/heroes/?filters[0][field]=age&filters[0][operator]=gte&filters[0][value]=18"
+        "&filters[2][field]=name&filters[2][operator]=eq&filters[2][value]=nobody"
+    )
+    assert r.status_code == 200
+    assert {h["name"] for h in r.json()["data"]} == {"Rusty-Man", "beta"}
+
+
+def test_indexed_filters_echoed_in_meta(session: Session, client: TestClient):
+    seed(session)
+    r = client.get("/heroes/?filters[0][field]=age&filters[0][operator]=gte&filters[0][value]=18")
+    assert r.status_code == 200
+    assert r.json()["meta"]["filters"] == [{"field": "age", "operator": "gte", "value": "18"}]
+
+
+def test_indexed_too_many_filters_returns_400(client: TestClient):
+    params = "&".join(
+        f"filters[{i}][field]=age&filters[{i}][operator]=gte&filters[{i}][value]=1"
+        for i in range(65)
+    )
+    r = client.get(f"/heroes/?{params}")
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Too many filters; at most 64 are allowed."
@@ -142,3 +142,9 @@ def test_full_operator_coverage_sync(session: Session, client: TestClient):
     assert client.get("/heroes/?per_page=101").status_code == 422
     # mismatched filter params -> 400
     assert client.get("/heroes/?field=name&operator=eq").status_code == 400
+
+
+def test_too_many_simple_filters_returns_400(client: TestClient):
+    r = client.get("/heroes/?" + "&".join(["field=age&operator=gte&value=1"] * 65))
+    assert r.status_code == 400
+    assert client.get("/heroes/?" + "&".join(["field=age&operator=gte&value=1"] * 64)).is_success
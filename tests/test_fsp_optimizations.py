@@ -1,10 +1,14 @@
 """Tests for optimizations in FSPManager."""
 
+import inspect
 from datetime import datetime
+from unittest.mock import Mock
 
 import pytest
+from fastapi_fsp import fsp as fsp_module
+from fastapi_fsp.filters import FilterEngine
 from fastapi_fsp.fsp import FSPManager
-from fastapi_fsp.models import Filter, FilterOperator
+from fastapi_fsp.models import Filter, FilterOperator, PaginationQuery
 from sqlmodel import Field, Session, SQLModel, create_engine, select
 
 
@@ -142,10 +146,11 @@ def test_column_type_caching():
         assert pytype2 is int
         assert pytype1 is pytype2
 
-        # Verify cache has the entry
-        col_id = id(age_col)
-        assert col_id in fsp._type_cache
-        assert fsp._type_cache[col_id] is int
+        # Verify the manager and the engine agree on the cached type
+        assert FilterEngine.get_column_type(age_col) is int
+
+        # Verify the type is memoized on the column itself
+        assert age_col.__dict__["_fsp_python_type"] is int
 
 
 def test_build_filter_condition():
@@ -345,3 +350,35 @@ def test_filter_condition_with_cached_type():
             age_col, Filter(field="age", operator=FilterOperator.EQ, value="30"), pytype
         )
         assert condition is not None
+
+
+def test_model_columns_cached_per_model():
+    """from_model reuses one column map per model class."""
+    columns = fsp_module._model_columns(HeroOptimization)
+    assert fsp_module._model_columns(HeroOptimization) is columns
+    assert list(columns.keys()) == list(select(HeroOptimization).selected_columns.keys())
+
+
+def test_from_model_uses_cached_columns(session):
+    session.add_all([HeroOptimization(name="A", age=20), HeroOptimization(name="B", age=40)])
+    session.commit()
+    request = Mock()
+    request.url = Mock()
+    request.url.include_query_params = Mock(return_value="http://example.com")
+    fsp = FSPManager(
+        request=request,
+        filters=[Filter(field="age", operator=FilterOperator.GTE, value="30")],
+        sorting=None,
+        pagination=PaginationQuery(page=1, per_page=10),
+        or_filters=None,
+    )
+    response = fsp.from_model(HeroOptimization, session)
+    assert [hero.name for hero in response.data] == ["B"]
+
+
+@pytest.mark.parametrize(
+    "parser", ["_parse_filters", "_parse_search", "_parse_sort", "_parse_pagination"]
+)
+def test_request_parsers_are_async(parser):
+    """Parser dependencies run inline on the event loop, not in the threadpool."""
+    assert inspect.iscoroutinefunction(getattr(fsp_module, parser))
@@ -235,3 +235,29 @@ def test_strict_mode_multiple_filters_with_one_invalid(session):
     )
     assert response.status_code == 400
     assert "invalid" in response.json()["detail"].lower()
+
+
+def test_strict_mode_does_not_leak_between_managers():
+    """Engines are shared process-wide, so toggling strict mode must not mutate them."""
+    from unittest.mock import Mock
+
+    from fastapi_fsp.models import PaginationQuery
+
+    def make_manager():
+        return FSPManager(
+            request=Mock(),
+            filters=None,
+            sorting=None,
+            pagination=PaginationQuery(page=1, per_page=10),
+            or_filters=None,
+        )
+
+    strict, lenient = make_manager(), make_manager()
+    assert strict._filter_engine is lenient._filter_engine
+
+    strict.strict_mode = True
+    assert strict.strict_mode is True
+    assert strict._sort_engine.strict_mode is True
+    assert lenient.strict_mode is False
+    assert lenient._sort_engine.strict_mode is False
+    assert make_manager().strict_mode is False
@@ -0,0 +1,146 @@
+"""Tests for keyset (cursor) pagination."""
+
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from fastapi_fsp.fsp import FSPManager
+from fastapi_fsp.pagination import decode_cursor, encode_cursor
+from sqlalchemy import Column, Date, StaticPool
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+from starlette.datastructures import URL, QueryParams
+
+
+class KeysetItem(SQLModel, table=True):
+    __tablename__ = "keyset_item"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    age: int
+    created_at: datetime
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    start = datetime(2024, 1, 1)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                KeysetItem(name=f"item{i}", age=i % 4, created_at=start + timedelta(days=i))
+                for i in range(12)
+            ]
+        )
+        session.commit()
+        yield session
+
+
+@pytest.fixture(name="client")
+def client_fixture(session: Session):
+    app = FastAPI()
+
+    def get_session():
+        yield session
+
+    @app.get("/items/")
+    def read_items(session: Session = Depends(get_session), fsp: FSPManager = Depends(FSPManager)):
+        return fsp.generate_keyset_response(select(KeysetItem), session, [KeysetItem.id])
+
+    @app.get("/items/by_age/")
+    def read_items_by_age(
+        session: Session = Depends(get_session), fsp: FSPManager = Depends(FSPManager)
+    ):
+        return fsp.generate_keyset_response(
+            select(KeysetItem), session, [KeysetItem.age, KeysetItem.id], descending=True
+        )
+
+    return TestClient(app)
+
+
+def walk(client: TestClient, url: str):
+    pages = []
+    while url:
+        r = client.get(url)
+        assert r.status_code == 200
+        body = r.json()
+        pages.append([item["name"] for item in body["data"]])
+        url = body["links"]["next"]
+    return pages, body
+
+
+def test_walks_all_pages(client: TestClient):
+    pages, last = walk(client, "/items/?per_page=5")
+    assert [len(p) for p in pages] == [5, 5, 2]
+    assert sum(pages, []) == [f"item{i}" for i in range(12)]
+    assert last["meta"]["pagination"]["total_items"] is None
+    assert last["meta"]["pagination"]["total_pages"] is None
+    assert last["links"]["last"] is None
+
+
+def test_next_link_carries_cursor(client: TestClient):
+    body = client.get("/items/?per_page=5&page=3").json()
+    params = QueryParams(URL(body["links"]["next"]).query)
+    assert "cursor" in params
+    assert "page" not in params
+    assert params["per_page"] == "5"
+
+
+def test_exact_multiple_has_no_extra_page(client: TestClient):
+    pages, _ = walk(client, "/items/?per_page=6")
+    assert [len(p) for p in pages] == [6, 6]
+
+
+def test_filters_applied(client: TestClient):
+    pages, _ = walk(client, "/items/?per_page=2&field=age&operator=eq&value=1")
+    assert sum(pages, []) == ["item1", "item5", "item9"]
+
+
+def test_multi_column_descending(client: TestClient):
+    pages, _ = walk(client, "/items/by_age/?per_page=5")
+    names = sum(pages, [])
+    expected = sorted(range(12), key=lambda i: (i % 4, i), reverse=True)
+    assert names == [f"item{i}" for i in expected]
+
+
+def test_invalid_cursor_returns_400(client: TestClient):
+    cursors = (
+        "not-base64!",
+        encode_cursor([1, 2]),
+        "bnVsbA",
+        encode_cursor([[1]]),
+        encode_cursor([{"a": 1}]),
+        encode_cursor(["abc"]),
+    )
+    for cursor in cursors:
+        r = client.get(f"/items/?cursor={cursor}")
+        assert r.status_code == 400
+        assert r.json()["detail"] == "Invalid pagination cursor."
+
+
+def test_cursor_round_trip_coerces_types():
+    when = datetime(2024, 5, 6, 7, 8, 9)
+    cursor = encode_cursor([when, 3])
+    assert decode_cursor(cursor, [KeysetItem.created_at, KeysetItem.id]) == [when, 3]
+
+
+def test_cursor_round_trip_date_key():
+    cursor = encode_cursor([date(2024, 5, 6)])
+    assert decode_cursor(cursor, [Column("day", Date)]) == [date(2024, 5, 6)]
+
+
+def test_decode_cursor_rejects_uncoercible_values():
+    for values in ([[1]], [{"a": 1}], ["abc"], ["yesterday-ish"]):
+        with pytest.raises(HTTPException):
+            decode_cursor(encode_cursor(values), [KeysetItem.id])
+    with pytest.raises(HTTPException):
+        decode_cursor(encode_cursor(["not a date"]), [Column("day", Date)])
+
+
+def test_decode_cursor_length_mismatch():
+    with pytest.raises(HTTPException):
+        decode_cursor(encode_cursor([1]), [KeysetItem.age, KeysetItem.id])
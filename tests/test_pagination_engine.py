@@ -1,12 +1,25 @@
 """Tests for PaginationEngine with window function optimization."""
 
 from typing import Optional
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from fastapi_fsp.models import PaginationQuery
-from fastapi_fsp.pagination import PaginationEngine, _detect_postgresql
+from fastapi_fsp.pagination import (
+    CountCache,
+    PaginationEngine,
+    _count_query,
+    _detect_postgresql,
+    _explain_statement,
+    _late_row_lookup_query,
+    _page_link_formatter,
+    _plan_rows,
+    _sampled_count_query,
+)
+from sqlalchemy import event, func
+from sqlalchemy.dialects import postgresql
 from sqlmodel import Field, Session, SQLModel, create_engine, select
+from starlette.datastructures import URL
 
 
 class PaginationTestModel(SQLModel, table=True):
@@ -171,6 +184,75 @@ class TestPaginateWithCount:
         mock_session = Mock()
         assert pe._should_use_window_function(mock_session) is True
 
+    @pytest.mark.parametrize(
+        ("page", "per_page", "expected_total", "expected_statements"),
+        [
+            (1, 20, 15, 1),  # everything fits on the first page
+            (2, 10, 15, 1),  # partial last page
+            (3, 5, 15, 2),  # full last page still needs a count
+            (4, 10, 15, 2),  # past the end
+            (1, 15, 15, 2),
+        ],
+    )
+    def test_partial_page_skips_count(
+        self, seeded_session, mock_request, page, per_page, expected_total, expected_statements
+    ):
+        pagination = PaginationQuery(page=page, per_page=per_page)
+        pe = PaginationEngine(pagination=pagination, request=mock_request)
+        statements = []
+
+        def capture(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        bind = seeded_session.get_bind()
+        event.listen(bind, "before_cursor_execute", capture)
+        try:
+            _, total = pe.paginate_with_count(select(PaginationTestModel), seeded_session)
+        finally:
+            event.remove(bind, "before_cursor_execute", capture)
+
+        assert total == expected_total
+        assert len(statements) == expected_statements
+
+    def test_window_function_entity_rows(self, seeded_session, mock_request):
+        pagination = PaginationQuery(page=2, per_page=5)
+        pe = PaginationEngine(pagination=pagination, request=mock_request, use_window_function=True)
+        data, total = pe.paginate_with_count(
+            select(PaginationTestModel).order_by(PaginationTestModel.age), seeded_session
+        )
+        assert total == 15
+        assert [item.name for item in data] == [f"Item{i}" for i in range(5, 10)]
+
+    def test_window_function_column_rows(self, seeded_session, mock_request):
+        pagination = PaginationQuery(page=1, per_page=2)
+        pe = PaginationEngine(pagination=pagination, request=mock_request, use_window_function=True)
+        query = select(PaginationTestModel.name, PaginationTestModel.age).order_by(
+            PaginationTestModel.age
+        )
+        data, total = pe.paginate_with_count(query, seeded_session)
+        assert total == 15
+        assert data == [{"name": "Item0", "age": 20}, {"name": "Item1", "age": 21}]
+
+    def test_window_function_empty(self, seeded_session, mock_request):
+        pagination = PaginationQuery(page=1, per_page=2)
+        pe = PaginationEngine(pagination=pagination, request=mock_request, use_window_function=True)
+        query = select(PaginationTestModel).where(PaginationTestModel.age > 100)
+        assert pe.paginate_with_count(query, seeded_session) == ([], 0)
+
+    def test_window_function_page_past_end_keeps_total(self, seeded_session, mock_request):
+        pagination = PaginationQuery(page=5, per_page=5)
+        pe = PaginationEngine(pagination=pagination, request=mock_request, use_window_function=True)
+        data, total = pe.paginate_with_count(select(PaginationTestModel), seeded_session)
+        assert data == []
+        assert total == 15
+
+    def test_partial_page_skips_count_with_filters(self, seeded_session, mock_request):
+        pagination = PaginationQuery(page=1, per_page=10)
+        pe = PaginationEngine(pagination=pagination, request=mock_request)
+        query = select(PaginationTestModel).where(PaginationTestModel.age >= 30)
+        data, total = pe.paginate_with_count(query, seeded_session)
+        assert len(data) == total == 5
+
 
 class TestBuildResponse:
     """Tests for response building."""
@@ -213,6 +295,17 @@ class TestBuildResponse:
         assert response.meta.pagination.total_items == 0
         assert response.meta.pagination.total_pages == 1
 
+    @pytest.mark.parametrize(
+        ("total_items", "expected"),
+        [(1, 1), (10, 1), (11, 2), (20, 2), (10 * 2**53 + 1, 2**53 + 1)],
+    )
+    def test_build_response_total_pages(self, mock_request, total_items, expected):
+        pagination = PaginationQuery(page=1, per_page=10)
+        pe = PaginationEngine(pagination=pagination, request=mock_request)
+
+        response = pe.build_response(total_items=total_items, data_page=[])
+        assert response.meta.pagination.total_pages == expected
+
     def test_build_response_links(self, mock_request):
         pagination = PaginationQuery(page=2, per_page=10)
         pe = PaginationEngine(pagination=pagination, request=mock_request)
@@ -224,6 +317,38 @@ class TestBuildResponse:
         assert response.links.next is not None
         assert response.links.prev is not None
 
+    def test_build_response_links_real_url(self):
+        request = Mock()
+        request.url = URL("http://example.com/heroes/?field=age&page=2&per_page=10&value=30")
+        pagination = PaginationQuery(page=2, per_page=10)
+        pe = PaginationEngine(pagination=pagination, request=request)
+
+        response = pe.build_response(total_items=30, data_page=[])
+        base = "http://example.com/heroes/?field=age&value=30"
+        assert response.links.self == f"{base}&page=2&per_page=10"
+        assert response.links.first == f"{base}&page=1&per_page=10"
+        assert response.links.last == f"{base}&page=3&per_page=10"
+        assert response.links.next == f"{base}&page=3&per_page=10"
+        assert response.links.prev == f"{base}&page=1&per_page=10"
+
+
+class TestPageLinkFormatter:
+    """Tests for the pagination link formatter."""
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "http://example.com/heroes/",
+            "http://example.com/heroes/?page=4",
+            "http://example.com/heroes/?per_page=5&name=a%20b&page=2&name=c",
+        ],
+    )
+    def test_matches_include_query_params(self, raw):
+        url = URL(raw)
+        page_url = _page_link_formatter(url, 25)
+        for page in (1, 2, 10):
+            assert page_url(page) == str(url.include_query_params(page=page, per_page=25))
+
 
 class TestStaticCountMethods:
     """Tests for static count methods (backward compatibility)."""
@@ -232,3 +357,301 @@ class TestStaticCountMethods:
         query = select(PaginationTestModel)
         total = PaginationEngine._count_total_static(query, seeded_session)
         assert total == 15
+
+    def test_count_total_static_does_not_wrap_subquery(self, seeded_session):
+        """Count should run as a flat SELECT count(*) without ORDER BY or a subquery."""
+        statements = []
+
+        def capture(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        bind = seeded_session.get_bind()
+        event.listen(bind, "before_cursor_execute", capture)
+        try:
+            query = select(PaginationTestModel).where(PaginationTestModel.age > 25)
+            total = PaginationEngine._count_total_static(
+                query.order_by(PaginationTestModel.name), seeded_session
+            )
+        finally:
+            event.remove(bind, "before_cursor_execute", capture)
+
+        assert total == 9
+        sql = statements[-1].upper()
+        assert "COUNT(*)" in sql
+        assert "ORDER BY" not in sql
+        assert sql.count("SELECT") == 1
+
+    def test_count_total_static_group_by_counts_groups(self, seeded_session):
+        query = select(PaginationTestModel.age % 5).group_by(PaginationTestModel.age % 5)
+        assert PaginationEngine._count_total_static(query, seeded_session) == 5
+
+    def test_count_total_static_distinct(self, seeded_session):
+        query = select(PaginationTestModel.age % 3).distinct().order_by(PaginationTestModel.age % 3)
+        assert PaginationEngine._count_total_static(query, seeded_session) == 3
+
+    def test_count_total_static_respects_limit(self, seeded_session):
+        query = select(PaginationTestModel).limit(4)
+        assert PaginationEngine._count_total_static(query, seeded_session) == 4
+
+    def test_count_query_wraps_fetch(self):
+        sql = str(_count_query(select(PaginationTestModel).fetch(4)))
+        assert "FROM (SELECT" in sql
+        assert "FETCH FIRST" in sql
+
+
+class TestCountCache:
+    """Tests for the opt-in count cache."""
+
+    def test_get_set(self):
+        cache = CountCache()
+        assert cache.get(b"k") is None
+        cache.set(b"k", 15)
+        assert cache.get(b"k") == 15
+
+    def test_expiry(self):
+        cache = CountCache(ttl=10)
+        with patch("fastapi_fsp.pagination.monotonic", return_value=100.0):
+            cache.set(b"k", 15)
+        with patch("fastapi_fsp.pagination.monotonic", return_value=109.0):
+            assert cache.get(b"k") == 15
+        with patch("fastapi_fsp.pagination.monotonic", return_value=110.0):
+            assert cache.get(b"k") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = CountCache(maxsize=2)
+        cache.set(b"a", 1)
+        cache.set(b"b", 2)
+        cache.get(b"a")
+        cache.set(b"c", 3)
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == 1
+        assert cache.get(b"c") == 3
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            CountCache(ttl=0)
+        with pytest.raises(ValueError):
+            CountCache(maxsize=0)
+
+    def test_key_depends_on_parameters(self):
+        query = select(PaginationTestModel)
+        young = CountCache.key_for(query.where(PaginationTestModel.age < 25))
+        old = CountCache.key_for(query.where(PaginationTestModel.age < 30))
+        assert young != old
+        assert young == CountCache.key_for(query.where(PaginationTestModel.age < 25))
+
+    def test_count_total_uses_cache(self, seeded_session, mock_request):
+        cache = CountCache()
+        pagination = PaginationQuery(page=1, per_page=5)
+        pe = PaginationEngine(pagination=pagination, request=mock_request, count_cache=cache)
+        statements = []
+
+        def capture(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        bind = seeded_session.get_bind()
+        event.listen(bind, "before_cursor_execute", capture)
+        try:
+            query = select(PaginationTestModel).where(PaginationTestModel.age > 25)
+            assert pe.count_total(query, seeded_session) == 9
+            assert pe.count_total(query.order_by(PaginationTestModel.name), seeded_session) == 9
+            cache.invalidate()
+            assert pe.count_total(query, seeded_session) == 9
+        finally:
+            event.remove(bind, "before_cursor_execute", capture)
+
+        assert len(statements) == 2
+
+
+class TestLateRowLookup:
+    """Tests for offset pagination through a primary-key subquery."""
+
+    def _page(self, session, request, query, page, late):
+        pagination = PaginationQuery(page=page, per_page=4)
+        pe = PaginationEngine(pagination=pagination, request=request, use_late_row_lookup=late)
+        return [item.name for item in pe.paginate(query, session)]
+
+    def test_same_pages_as_plain_offset(self, seeded_session, mock_request):
+        query = (
+            select(PaginationTestModel)
+            .where(PaginationTestModel.age > 22)
+            .order_by(PaginationTestModel.age.desc())
+        )
+        for page in range(1, 5):
+            assert self._page(seeded_session, mock_request, query, page, True) == self._page(
+                seeded_session, mock_request, query, page, False
+            )
+
+    def test_offset_applied_to_pk_subquery(self):
+        query = select(PaginationTestModel).order_by(PaginationTestModel.name)
+        sql = str(_late_row_lookup_query(query, 8, 4))
+        assert "JOIN (SELECT pagination_test_model.id AS id" in sql
+        assert sql.count("OFFSET") == 1
+
+    def test_first_page_not_rewritten(self):
+        assert _late_row_lookup_query(select(PaginationTestModel), 0, 4) is None
+
+    def test_unsupported_queries_not_rewritten(self):
+        query = select(PaginationTestModel)
+        assert _late_row_lookup_query(query.distinct(), 8, 4) is None
+        assert _late_row_lookup_query(query.limit(3), 8, 4) is None
+        assert _late_row_lookup_query(query.fetch(3), 8, 4) is None
+        assert (
+            _late_row_lookup_query(
+                select(PaginationTestModel.age, func.count()).group_by(PaginationTestModel.age),
+                8,
+                4,
+            )
+            is None
+        )
+        other = PaginationTestModel.__table__.alias("other")
+        joined = query.join(other, other.c.id == PaginationTestModel.id)
+        assert _late_row_lookup_query(joined, 8, 4) is None
+
+    def test_unsupported_query_falls_back_to_offset(self, seeded_session, mock_request):
+        query = select(PaginationTestModel).distinct()
+        assert len(self._page(seeded_session, mock_request, query, 2, True)) == 4
+
+
+class TestApproximateCount:
+    """Tests for PostgreSQL planner-estimate totals."""
+
+    def test_explain_statement_pyformat(self):
+        query = select(PaginationTestModel).where(PaginationTestModel.age > 25)
+        sql, params = _explain_statement(
+            query.order_by(PaginationTestModel.name), postgresql.psycopg2.dialect()
+        )
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "ORDER BY" not in sql
+        assert "%(age_1)s" in sql
+        assert params == {"age_1": 25}
+
+        in_query = select(PaginationTestModel).where(PaginationTestModel.age.in_([1, 2]))
+        sql, params = _explain_statement(in_query, postgresql.psycopg2.dialect())
+        assert "POSTCOMPILE" not in sql
+        assert "IN (%(age_1_1)s, %(age_1_2)s)" in sql
+        assert params == {"age_1_1": 1, "age_1_2": 2}
+
+    def test_explain_statement_positional(self):
+        query = select(PaginationTestModel).where(
+            PaginationTestModel.age > 25, PaginationTestModel.name == "x"
+        )
+        sql, params = _explain_statement(query, postgresql.asyncpg.dialect())
+        assert "$1" in sql and "$2" in sql
+        assert params == (25, "x")
+
+        in_query = select(PaginationTestModel).where(
+            PaginationTestModel.age.not_in([1, 2]), PaginationTestModel.name == "x"
+        )
+        sql, params = _explain_statement(in_query, postgresql.asyncpg.dialect())
+        assert "POSTCOMPILE" not in sql
+        assert "NOT IN ($2::INTEGER, $3::INTEGER)" in sql
+        assert "name = $1" in sql
+        assert params == ("x", 1, 2)
+
+    def test_plan_rows(self):
+        plan = [{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 1234}}]
+        assert _plan_rows(plan) == 1234
+        assert _plan_rows('[{"Plan": {"Plan Rows": 7}}]') == 7
+
+    def _pg_session(self, plan_rows):
+        connection = Mock()
+        connection.dialect = postgresql.psycopg2.dialect()
+        connection.exec_driver_sql.return_value.scalar_one.return_value = [
+            {"Plan": {"Plan Rows": plan_rows}}
+        ]
+        session = Mock()
+        session.bind.dialect.name = "postgresql"
+        session.connection.return_value = connection
+        return session
+
+    def test_count_total_uses_estimate_on_postgresql(self, mock_request):
+        pe = PaginationEngine(
+            pagination=PaginationQuery(page=1, per_page=5),
+            request=mock_request,
+            approximate_count=True,
+        )
+        session = self._pg_session(1234)
+        assert pe.count_total(select(PaginationTestModel), session) == 1234
+        session.exec.assert_not_called()
+
+    def test_estimate_not_below_fetched_rows(self, mock_request):
+        pe = PaginationEngine(
+            pagination=PaginationQuery(page=3, per_page=5),
+            request=mock_request,
+            use_window_function=True,
+            approximate_count=True,
+        )
+        session = self._pg_session(4)
+        session.exec.return_value.all.return_value = list(range(5))
+        data, total = pe.paginate_with_count(select(PaginationTestModel), session)
+        assert total == 15
+        session.execute.assert_not_called()
+
+    def test_exact_count_off_postgresql(self, seeded_session, mock_request):
+        pe = PaginationEngine(
+            pagination=PaginationQuery(page=1, per_page=5),
+            request=mock_request,
+            approximate_count=True,
+        )
+        assert pe.count_total(select(PaginationTestModel), seeded_session) == 15
+
+    def test_sampled_count_query(self):
+        query = select(PaginationTestModel).where(PaginationTestModel.age > 25)
+        sql = str(
+            _sampled_count_query(query.order_by(PaginationTestModel.name), 2.5).compile(
+                dialect=postgresql.psycopg2.dialect()
+            )
+        )
+        assert "FROM pagination_test_model AS pagination_test_model TABLESAMPLE system(" in sql
+        assert "WHERE pagination_test_model.age > %(age_1)s" in sql
+        assert "ORDER BY" not in sql
+
+    def test_sampled_count_query_unsupported(self):
+        other = PaginationTestModel.__table__.alias("other")
+        joined = select(PaginationTestModel).join(other, other.c.id == PaginationTestModel.id)
+        assert _sampled_count_query(joined, 1) is None
+        assert _sampled_count_query(select(PaginationTestModel).distinct(), 1) is None
+        assert _sampled_count_query(select(PaginationTestModel).fetch(3), 1) is None
+
+    def test_count_total_scales_sample(self, mock_request):
+        pe = PaginationEngine(
+            pagination=PaginationQuery(page=1, per_page=5),
+            request=mock_request,
+            count_sample_percent=2,
+        )
+        session = self._pg_session(1234)
+        session.exec.return_value.one.return_value = 13
+        assert pe.count_total(select(PaginationTestModel), session) == 650
+        session.connection.assert_not_called()
+
+    def test_empty_sample_counts_exactly(self, mock_request):
+        pe = PaginationEngine(
+            pagination=PaginationQuery(page=1, per_page=5),
+            request=mock_request,
+            approximate_count=True,
+            count_sample_percent=1,
+        )
+        session = self._pg_session(1234)
+        session.exec.return_value.one.side_effect = [0, 57]
+        assert pe.count_total(select(PaginationTestModel), session) == 57
+
+    def test_unsampleable_query_uses_explain(self, mock_request):
+        pe = PaginationEngine(
+            pagination=PaginationQuery(page=1, per_page=5),
+            request=mock_request,
+            approximate_count=True,
+            count_sample_percent=1,
+        )
+        session = self._pg_session(1234)
+        assert pe.count_total(select(PaginationTestModel).distinct(), session) == 1234
+
+    @pytest.mark.parametrize("percent", [0, -1, 101])
+    def test_invalid_sample_percent(self, mock_request, percent):
+        with pytest.raises(ValueError, match="count_sample_percent"):
+            PaginationEngine(
+                pagination=PaginationQuery(page=1, per_page=5),
+                request=mock_request,
+                count_sample_percent=percent,
+            )
@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 
 import pytest
+from fastapi_fsp import presets
 from fastapi_fsp.models import FilterOperator
 from fastapi_fsp.presets import CommonFilters
 
@@ -68,6 +69,27 @@ class TestCommonFilters:
 
         assert filters[0].field == "updated_at"
 
+    def test_recent_without_reference_uses_now(self):
+        """Test recent/older_than default to a cutoff from the current time."""
+        before = datetime.now() - timedelta(days=7)
+        recent = CommonFilters.recent(days=7)[0].value
+        older = CommonFilters.older_than(days=7)[0].value
+
+        assert recent == older
+        assert before <= datetime.fromisoformat(recent) <= datetime.now() - timedelta(days=7)
+
+    def test_now_cutoff_reused_within_ttl(self, monkeypatch):
+        """Test the current-time cutoff is recomputed only after the TTL."""
+        clock = [1000.0]
+        monkeypatch.setattr(presets, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(presets, "_now_cutoffs", {})
+
+        first = presets._now_cutoff(3)
+        clock[0] += 0.5
+        assert presets._now_cutoff(3) is first
+        clock[0] += 1.0
+        assert presets._now_cutoff(3) is not first
+
     def test_older_than_default(self):
         """Test older_than filter with default values."""
         reference = datetime(2024, 6, 15, 12, 0, 0)
@@ -96,11 +118,9 @@ class TestCommonFilters:
         end = datetime(2024, 12, 31)
         filters = CommonFilters.date_range(start=start, end=end)
 
-        assert len(filters) == 2
-        assert filters[0].operator == FilterOperator.GTE
-        assert filters[0].value == start.isoformat()
-        assert filters[1].operator == FilterOperator.LTE
-        assert filters[1].value == end.isoformat()
+        assert len(filters) == 1
+        assert filters[0].operator == FilterOperator.BETWEEN
+        assert filters[0].value == f"{start.isoformat()},{end.isoformat()}"
 
     def test_date_range_start_only(self):
         """Test date_range with only start."""
@@ -240,6 +260,12 @@ class TestCommonFilters:
 
         assert filters[0].value == "1,2,3,4,5"
 
+    def test_in_values_mixed_and_iterables(self):
+        """Test in_values with mixed types and non-list iterables."""
+        assert CommonFilters.in_values("id", ["a", 1, 2.5])[0].value == "a,1,2.5"
+        assert CommonFilters.in_values("id", (v for v in ["a", 1]))[0].value == "a,1"
+        assert CommonFilters.not_in_values("id", ("x", "y"))[0].value == "x,y"
+
     def test_not_in_values(self):
         """Test not_in_values filter."""
         filters = CommonFilters.not_in_values("category", ["spam", "deleted"])
@@ -263,3 +289,14 @@ class TestCommonFilters:
         filters = CommonFilters.active() + CommonFilters.enabled() + CommonFilters.not_null("email")
 
         assert len(filters) == 3
+
+    def test_fixed_presets_return_fresh_filters(self):
+        """Test mutating a returned preset filter does not leak into later calls."""
+        first = CommonFilters.active()
+        first[0].value = "true"
+        first.append(CommonFilters.enabled()[0])
+
+        again = CommonFilters.active()
+        assert again[0] is not first[0]
+        assert len(again) == 1
+        assert again[0].value == "false"
@@ -123,6 +123,24 @@ class TestCoerceValue:
         result = FSPManager._coerce_value(columns["age"], "42", pytype=int)
         assert result == 42
 
+    def test_coerce_repeated_value_is_cached(self, columns):
+        """Test repeated coercions of the same (type, value) pair hit the cache."""
+        from fastapi_fsp.filters import _coerce_cached
+
+        FSPManager._coerce_value(columns["age"], "4242")
+        hits = _coerce_cached.cache_info().hits
+        result = FSPManager._coerce_value(columns["age"], "4242")
+        assert result == 4242
+        assert _coerce_cached.cache_info().hits == hits + 1
+
+    def test_coerce_slash_separated_datetime(self, columns):
+        """Test common non-ISO layouts parse without the dateutil fallback."""
+        from fastapi_fsp.filters import _UNPARSED_DATETIME, _coerce_cached
+
+        assert _coerce_cached(datetime, "2024/01/15") == datetime(2024, 1, 15)
+        assert _coerce_cached(datetime, "2024/01/15 10:30:00") == datetime(2024, 1, 15, 10, 30)
+        assert _coerce_cached(datetime, "January 15, 2024") is _UNPARSED_DATETIME
+
     def test_coerce_with_none_pytype(self, columns):
         """Test coercing when pytype is None returns original."""
         # Create a mock column with no python_type
@@ -167,6 +185,16 @@ class TestSplitValues:
         result = FSPManager._split_values("active, pending, 42, true")
         assert result == ["active", "pending", "42", "true"]
 
+    def test_split_with_tabs_and_newlines(self):
+        """Test that any surrounding whitespace is stripped, not just spaces."""
+        result = FSPManager._split_values("\ta,\n b\t,c\n")
+        assert result == ["a", "b", "c"]
+
+    def test_split_keeps_empty_items(self):
+        """Test that empty items between commas are preserved."""
+        result = FSPManager._split_values("a, ,b,")
+        assert result == ["a", "", "b", ""]
+
 
 class TestBuildFilterCondition:
     """Tests for _build_filter_condition method."""
@@ -395,3 +423,35 @@ class TestApplyFilters:
 
         assert exc_info.value.status_code == 400
         assert "Unknown field" in str(exc_info.value.detail)
+
+
+class TestWithFilters:
+    """Tests for the with_filters family of fluent setters."""
+
+    @pytest.fixture
+    def fsp_manager(self):
+        return FSPManager(
+            request=Mock(),
+            filters=None,
+            sorting=None,
+            pagination=PaginationQuery(page=1, per_page=20),
+            or_filters=None,
+        )
+
+    def test_first_list_is_stored_without_copy(self, fsp_manager):
+        filters = [Filter(field="age", operator=FilterOperator.GTE, value="18")]
+        assert fsp_manager.with_filters(filters).filters is filters
+
+    def test_append_does_not_mutate_caller_list(self, fsp_manager):
+        shared = [Filter(field="age", operator=FilterOperator.GTE, value="18")]
+        extra = [Filter(field="active", operator=FilterOperator.EQ, value="true")]
+        fsp_manager.with_filters(shared).with_filters(extra)
+        assert fsp_manager.filters == shared + extra
+        assert len(shared) == 1
+
+    def test_replace(self, fsp_manager):
+        first = [Filter(field="age", operator=FilterOperator.GTE, value="18")]
+        second = [Filter(field="active", operator=FilterOperator.EQ, value="true")]
+        fsp_manager.with_filters(first).with_filters_replace(second)
+        assert fsp_manager.filters == second
+        assert fsp_manager.with_filters_replace([]).filters is None
@@ -333,6 +333,17 @@ class TestTokenSearchEdgeCases:
         assert r_phrase.status_code == 200
         assert len(r_token.json()["data"]) == len(r_phrase.json()["data"])
 
+    def test_search_fields_with_blanks_and_spaces(self, session, client):
+        seed_heroes(session)
+        r = client.get("/heroes/?search=dead&search_fields=%20name%20,,secret_name,")
+        assert r.status_code == 200
+        meta_fields = [f["field"] for f in r.json()["meta"]["or_filters"][0]["filters"]]
+        assert meta_fields == ["name", "secret_name"]
+
+    def test_search_fields_only_commas_returns_400(self, session, client):
+        r = client.get("/heroes/?search=dead&search_fields=,%20,")
+        assert r.status_code == 400
+
 
 class TestTokenSearchLargeDataset:
     """Baseline tests with 1000+ rows."""